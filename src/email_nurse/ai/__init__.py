@@ -2,6 +2,7 @@
 
 from email_nurse.ai.base import AIProvider, EmailAction, EmailClassification
 from email_nurse.ai.claude import ClaudeProvider
+from email_nurse.ai.factory import create_ai_provider
 from email_nurse.ai.ollama import OllamaProvider
 from email_nurse.ai.openai import OpenAIProvider
 
@@ -12,4 +13,5 @@ __all__ = [
     "ClaudeProvider",
     "OpenAIProvider",
     "OllamaProvider",
+    "create_ai_provider",
 ]
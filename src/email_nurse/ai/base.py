@@ -99,6 +99,23 @@ class AIProvider(ABC):
         """Check if the AI provider is available and properly configured."""
         ...
 
+    def close(self) -> None:
+        """Release the provider's HTTP client and its pooled connections.
+
+        The client is created lazily and reused for every request, so this
+        only needs to be called once the provider is no longer needed.
+        """
+        client = getattr(self, "_client", None)
+        if client is not None:
+            client.close()
+            self._client = None
+
+    async def __aenter__(self) -> "AIProvider":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.close()
+
     @abstractmethod
     async def autopilot_classify(
         self,
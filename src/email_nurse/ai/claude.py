@@ -1,5 +1,6 @@
 """Anthropic Claude AI provider implementation."""
 
+import asyncio
 import json
 import os
 from datetime import datetime
@@ -70,6 +71,16 @@ Infer action from verbs:
 
 Output ONLY the JSON object, no explanation or markdown."""
 
+# The schema prompt is identical for every parse, so bulk imports and repeated
+# add-rule runs can read it from the prompt cache instead of reprocessing it
+_QUICK_RULE_CACHED_SYSTEM = [
+    {
+        "type": "text",
+        "text": QUICK_RULE_SYSTEM_PROMPT,
+        "cache_control": {"type": "ephemeral"},
+    }
+]
+
 
 AUTOPILOT_SYSTEM_PROMPT = """You are an intelligent email assistant operating in autopilot mode. Your task is to process emails according to the user's natural language instructions and decide on the appropriate action.
 
@@ -143,6 +154,7 @@ class ClaudeProvider(AIProvider):
         self,
         api_key: str | None = None,
         model: str = "claude-haiku-4-5-20251001",
+        prompt_cache: bool = True,
     ) -> None:
         """
         Initialize the Claude provider.
@@ -150,9 +162,12 @@ class ClaudeProvider(AIProvider):
         Args:
             api_key: Anthropic API key. Falls back to ANTHROPIC_API_KEY env var.
             model: Model to use for classification.
+            prompt_cache: Mark the quick-rule system prompt as cacheable so
+                repeated parses read it from Anthropic's prompt cache.
         """
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         self.model = model
+        self.prompt_cache = prompt_cache
         self._client: "anthropic.Anthropic | None" = None
 
     @property
@@ -199,7 +214,10 @@ Content:
         if context:
             user_prompt = f"Context/Rules:\n{context}\n\n{user_prompt}"
 
-        message = self.client.messages.create(
+        # The SDK client is synchronous; run it off the event loop so
+        # concurrent classifications overlap their network round-trips
+        message = await asyncio.to_thread(
+            self.client.messages.create,
             model=self.model,
             max_tokens=1024,
             system=CLASSIFICATION_SYSTEM_PROMPT,
@@ -360,10 +378,12 @@ Based on the user's instructions above, decide what action to take for this emai
         if rule_name:
             user_prompt = f'Rule name: "{rule_name}"\nDescription: {description}'
 
-        message = self.client.messages.create(
+        # Off the event loop so several rules can be parsed concurrently
+        message = await asyncio.to_thread(
+            self.client.messages.create,
             model=haiku_model,
             max_tokens=500,
-            system=QUICK_RULE_SYSTEM_PROMPT,
+            system=_QUICK_RULE_CACHED_SYSTEM if self.prompt_cache else QUICK_RULE_SYSTEM_PROMPT,
             messages=[{"role": "user", "content": user_prompt}],
         )
 
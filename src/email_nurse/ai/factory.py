@@ -0,0 +1,69 @@
+"""AI provider construction from application settings."""
+
+from collections.abc import Callable
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from email_nurse.ai.base import AIProvider
+    from email_nurse.config import Settings
+
+
+# provider name -> (module, class, constructor kwargs from settings, model setting)
+_PROVIDER_SPECS: dict[str, tuple[str, str, Callable[["Settings"], dict[str, Any]], str]] = {
+    "claude": (
+        "email_nurse.ai.claude",
+        "ClaudeProvider",
+        lambda s: {
+            "api_key": s.anthropic_api_key,
+            "model": s.claude_model,
+            "prompt_cache": s.anthropic_prompt_cache_enabled,
+        },
+        "claude_model",
+    ),
+    "openai": (
+        "email_nurse.ai.openai",
+        "OpenAIProvider",
+        lambda s: {"api_key": s.openai_api_key, "model": s.openai_model},
+        "openai_model",
+    ),
+    "ollama": (
+        "email_nurse.ai.ollama",
+        "OllamaProvider",
+        lambda s: {"host": s.ollama_host, "model": s.ollama_model},
+        "ollama_model",
+    ),
+}
+
+
+def create_ai_provider(settings: "Settings", provider: str | None = None) -> "AIProvider":
+    """
+    Create an AI provider configured from settings.
+
+    Args:
+        settings: Application settings holding API keys, hosts, and models.
+        provider: Provider name, or None to use settings.ai_provider.
+
+    Returns:
+        The configured AIProvider instance.
+
+    Raises:
+        ValueError: If the provider name is not recognized.
+    """
+    name = provider or settings.ai_provider
+    spec = _PROVIDER_SPECS.get(name)
+    if spec is None:
+        raise ValueError(f"Unknown provider: {name}")
+
+    module_name, class_name, build_kwargs, _ = spec
+    provider_class: type[AIProvider] = getattr(import_module(module_name), class_name)
+    return provider_class(**build_kwargs(settings))
+
+
+def get_model_name(settings: "Settings", provider: str | None = None) -> str:
+    """Return the configured model name for a provider, or 'unknown'."""
+    spec = _PROVIDER_SPECS.get(provider or settings.ai_provider)
+    if spec is None:
+        return "unknown"
+    model: str = getattr(settings, spec[3])
+    return model
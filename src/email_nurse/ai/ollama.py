@@ -1,5 +1,6 @@
 """Ollama local LLM provider implementation."""
 
+import asyncio
 import json
 from typing import TYPE_CHECKING
 
@@ -108,7 +109,10 @@ Content:
         if context:
             prompt = f"Rules to follow:\n{context}\n\n{prompt}"
 
-        response = self.client.generate(
+        # The client is synchronous; run it off the event loop so
+        # concurrent classifications overlap their requests
+        response = await asyncio.to_thread(
+            self.client.generate,
             model=self.model,
             prompt=prompt,
             format="json",
@@ -1,5 +1,6 @@
 """OpenAI GPT provider implementation."""
 
+import asyncio
 import json
 import os
 from typing import TYPE_CHECKING
@@ -124,7 +125,10 @@ Content:
         if context:
             user_prompt = f"Rules:\n{context}\n\n{user_prompt}"
 
-        response = self.client.chat.completions.create(
+        # The SDK client is synchronous; run it off the event loop so
+        # concurrent classifications overlap their network round-trips
+        response = await asyncio.to_thread(
+            self.client.chat.completions.create,
             model=self.model,
             response_format={"type": "json_object"},
             messages=[
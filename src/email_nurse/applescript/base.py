@@ -1,15 +1,158 @@
 """AppleScript execution wrapper for macOS app integrations."""
 
+import atexit
+import json
+import select
 import subprocess
+import threading
+from functools import lru_cache
 from typing import Any
 
 from email_nurse.applescript.errors import AppleScriptError
 
+# JXA loop run by the persistent osascript process: each stdin line is a
+# JSON-encoded AppleScript source, each stdout line a JSON reply with either
+# "result" (the result as text) or "error" (message and number, formatted
+# like osascript's stderr so callers' error checks keep working). Compiled
+# scripts are kept by source text, so repeated scripts skip compilation.
+_RUNNER_JXA = """
+ObjC.import("Foundation");
+
+const MAX_COMPILED = 64;
+const compiled = new Map();
+
+function compile(source) {
+    let script = compiled.get(source);
+    if (script === undefined) {
+        script = $.NSAppleScript.alloc.initWithSource(source);
+        script.compileAndReturnError(null);
+        if (compiled.size >= MAX_COMPILED) {
+            compiled.delete(compiled.keys().next().value);
+        }
+        compiled.set(source, script);
+    }
+    return script;
+}
+
+function reply(output, message) {
+    output.writeData($(JSON.stringify(message) + "\\n").dataUsingEncoding($.NSUTF8StringEncoding));
+}
+
+function run() {
+    const input = $.NSFileHandle.fileHandleWithStandardInput;
+    const output = $.NSFileHandle.fileHandleWithStandardOutput;
+    let pending = "";
+    for (;;) {
+        const data = input.availableData;
+        if (data.length === 0) {
+            return;
+        }
+        pending += $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding).js;
+        let end;
+        while ((end = pending.indexOf("\\n")) >= 0) {
+            const source = JSON.parse(pending.slice(0, end));
+            pending = pending.slice(end + 1);
+            const error = Ref();
+            const result = compile(source).executeAndReturnError(error);
+            if (result.isNil()) {
+                const info = error[0];
+                const message = ObjC.unwrap(info.objectForKey("NSAppleScriptErrorMessage"));
+                const number = ObjC.unwrap(info.objectForKey("NSAppleScriptErrorNumber"));
+                reply(output, {error: `${message || "Unknown AppleScript error"} (${number})`});
+            } else {
+                reply(output, {result: ObjC.unwrap(result.stringValue) || ""});
+            }
+        }
+    }
+}
+"""
+
+
+class _RunnerUnavailableError(Exception):
+    """The persistent runner could not take a script; it was never run."""
+
+
+class _PersistentRunner:
+    """One long-lived osascript process that runs every script sent to it.
+
+    Spawning osascript and connecting to the target app costs far more than
+    most scripts take to run; this pays that cost once per process. Results
+    are coerced to text, which matches osascript's output for the string
+    results the integrations return. Compiled scripts are cached inside the
+    process, so fixed scripts such as get_local_mailboxes() compile once.
+    """
+
+    def __init__(self) -> None:
+        self._proc: subprocess.Popen[str] | None = None
+        self._lock = threading.Lock()
+
+    def _start(self) -> subprocess.Popen[str]:
+        self._proc = subprocess.Popen(
+            ["osascript", "-l", "JavaScript", "-e", _RUNNER_JXA],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+        )
+        return self._proc
+
+    def stop(self) -> None:
+        """Stop the osascript process; the next run starts a fresh one."""
+        proc, self._proc = self._proc, None
+        if proc is not None and proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+    def run(self, script: str, timeout: int) -> str:
+        with self._lock:
+            proc = self._proc
+            try:
+                if proc is None or proc.poll() is not None:
+                    proc = self._start()
+                stdin, stdout = proc.stdin, proc.stdout
+                assert stdin is not None and stdout is not None  # opened with PIPE
+                stdin.write(json.dumps(script) + "\n")
+                stdin.flush()
+            except OSError as e:
+                # The script never reached the runner, so running it another
+                # way cannot apply it twice
+                self.stop()
+                raise _RunnerUnavailableError(str(e)) from e
+            try:
+                ready, _, _ = select.select([stdout], [], [], timeout)
+                line = stdout.readline() if ready else None
+            except OSError as e:
+                self.stop()
+                raise AppleScriptError(f"AppleScript runner failed: {e}", script) from e
+            if line is None:
+                # The script may still be running; discard the process
+                self.stop()
+                raise AppleScriptError(f"AppleScript timed out after {timeout}s", script)
+            if not line:
+                self.stop()
+                raise AppleScriptError("AppleScript runner exited unexpectedly", script)
+
+        reply = json.loads(line)
+        if "error" in reply:
+            raise AppleScriptError(reply["error"], script)
+        result: str = reply["result"]
+        return result.strip()
+
+
+_runner = _PersistentRunner()
+atexit.register(_runner.stop)
+
 
 def run_applescript(script: str, *, timeout: int = 30) -> str:
     """
     Execute an AppleScript and return the output.
 
+    With applescript_persistent enabled, the script runs in a shared
+    long-lived osascript process instead of a new one per call. If that
+    process cannot be started or written to, the script runs in a one-off
+    osascript process instead.
+
     Args:
         script: The AppleScript code to execute.
         timeout: Maximum seconds to wait for execution.
@@ -20,6 +163,15 @@ def run_applescript(script: str, *, timeout: int = 30) -> str:
     Raises:
         AppleScriptError: If the script fails to execute.
     """
+    # Imported here so AppleScript callers do not load settings at import time
+    from email_nurse.config import get_settings
+
+    if get_settings().applescript_persistent:
+        try:
+            return _runner.run(script, timeout)
+        except _RunnerUnavailableError:
+            pass
+
     try:
         result = subprocess.run(
             ["osascript", "-e", script],
@@ -53,8 +205,6 @@ def run_applescript_json(script: str, *, timeout: int = 30) -> Any:
     Raises:
         AppleScriptError: If the script fails or output isn't valid JSON.
     """
-    import json
-
     output = run_applescript(script, timeout=timeout)
 
     if not output:
@@ -66,15 +216,24 @@ def run_applescript_json(script: str, *, timeout: int = 30) -> Any:
         raise AppleScriptError(f"Invalid JSON output: {e}", script) from e
 
 
+# Backslashes and quotes are escaped; control characters that break
+# AppleScript strings (newlines, tabs, carriage returns) become spaces.
+# One translate() pass applies them all, so no ordering is needed.
+_ESCAPE_TABLE = str.maketrans({
+    "\\": "\\\\",
+    '"': '\\"',
+    "\n": " ",
+    "\r": " ",
+    "\t": " ",
+})
+
+
+# Account, mailbox, and list names repeat across calls, so results are cached
+@lru_cache(maxsize=256)
 def escape_applescript_string(value: str) -> str:
     """Escape a string for safe inclusion in AppleScript.
 
     Handles backslashes, quotes, and control characters that would
     break AppleScript string syntax.
     """
-    # First escape backslashes, then quotes
-    result = value.replace("\\", "\\\\").replace('"', '\\"')
-    # Replace control characters that break AppleScript strings
-    # (newlines, tabs, carriage returns) with spaces
-    result = result.replace("\n", " ").replace("\r", " ").replace("\t", " ")
-    return result
+    return value.translate(_ESCAPE_TABLE)
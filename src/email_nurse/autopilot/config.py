@@ -6,6 +6,12 @@ from typing import Literal
 import yaml
 from pydantic import BaseModel, Field, model_validator
 
+from email_nurse.yaml_io import SafeDumper, SafeLoader
+
+# Parsed configs keyed by (path, mtime_ns, size); edits change the key
+_CONFIG_CACHE: dict[tuple[str, int, int], "AutopilotConfig"] = {}
+_CONFIG_CACHE_MAX = 32
+
 # Type alias for rule actions
 RuleAction = Literal["delete", "move", "archive", "mark_read", "ignore"]
 
@@ -73,6 +79,27 @@ class QuickRule(BaseModel):
             return [self.action]
         return []
 
+    def to_yaml_block(self) -> str:
+        """Render as a commented entry for the top-level quick_rules list.
+
+        Written by hand rather than with yaml.dump so the entry matches the
+        flow-style lists used in hand-edited configs.
+        """
+        lines = [f"  # {self.name}", f'  - name: "{self.name}"', "    match:"]
+        for key, patterns in self.match.items():
+            pattern_str = ", ".join(f'"{p}"' for p in patterns)
+            lines.append(f"      {key}: [{pattern_str}]")
+
+        if self.actions:
+            lines.append(f"    actions: [{', '.join(self.actions)}]")
+        elif self.action:
+            lines.append(f"    action: {self.action}")
+
+        if self.folder:
+            lines.append(f"    folder: {self.folder}")
+
+        return "\n".join(lines)
+
 
 class AutopilotConfig(BaseModel):
     """Autopilot configuration from YAML."""
@@ -181,26 +208,40 @@ def load_autopilot_config(path: Path) -> AutopilotConfig | None:
     """
     Load autopilot configuration from a YAML file.
 
+    Parsed configs are cached until the file's mtime or size changes.
+
     Args:
         path: Path to the autopilot.yaml file.
 
     Returns:
         AutopilotConfig if file exists and is valid, None otherwise.
     """
-    if not path.exists():
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         return None
 
-    with open(path) as f:
-        data = yaml.safe_load(f) or {}
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is None:
+        # Binary read: LibYAML decodes UTF-8 itself, skipping the text layer
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=SafeLoader) or {}
+
+        # Get the autopilot section
+        autopilot_data = data.get("autopilot", data)
 
-    # Get the autopilot section
-    autopilot_data = data.get("autopilot", data)
+        # Handle the case where instructions might be under a nested key
+        if "instructions" not in autopilot_data and "autopilot" in data:
+            autopilot_data = data["autopilot"]
 
-    # Handle the case where instructions might be under a nested key
-    if "instructions" not in autopilot_data and "autopilot" in data:
-        autopilot_data = data["autopilot"]
+        cached = AutopilotConfig(**autopilot_data)
+        if len(_CONFIG_CACHE) >= _CONFIG_CACHE_MAX:
+            _CONFIG_CACHE.pop(next(iter(_CONFIG_CACHE)))
+        _CONFIG_CACHE[key] = cached
 
-    return AutopilotConfig(**autopilot_data)
+    # Callers adjust the config (e.g. --account overrides), so hand out copies
+    return cached.model_copy(deep=True)
 
 
 def save_autopilot_config(path: Path, config: AutopilotConfig) -> None:
@@ -215,8 +256,16 @@ def save_autopilot_config(path: Path, config: AutopilotConfig) -> None:
 
     data = {"autopilot": config.model_dump(exclude_none=True)}
 
-    with open(path, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    with open(path, "wb") as f:
+        yaml.dump(
+            data,
+            f,
+            Dumper=SafeDumper,
+            encoding="utf-8",
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+        )
 
 
 DEFAULT_INSTRUCTIONS = """Handle my email according to these preferences:
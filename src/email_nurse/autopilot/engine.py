@@ -32,6 +32,7 @@ from email_nurse.mail.actions import (
     forward_message,
     get_all_mailboxes,
     get_local_mailboxes,
+    mailbox_exists,
     mark_as_read,
     move_message,
     move_messages_batch,
@@ -59,6 +60,9 @@ if TYPE_CHECKING:
 
 console = Console()
 
+# Mailbox fetches run at once (each is a sysm process talking to Mail.app)
+FETCH_CONCURRENCY = 4
+
 
 class AutopilotEngine(
     QuickRulesMixin,
@@ -399,43 +403,59 @@ class AutopilotEngine(
         accounts = self._validated_accounts_cache
         queue: list[EmailMessage] = []
 
+        sources: list[tuple[str, str]] = []
         for mailbox in self.config.mailboxes:
             for account in accounts:
                 actual_mailbox = self._validated_mailboxes_cache.get((mailbox, account))
-                if actual_mailbox is None:
-                    continue
+                if actual_mailbox is not None:
+                    sources.append((actual_mailbox, account))
+
+        # Each fetch is a blocking sysm call; run a few side by side in threads
+        # so Mail.app is not hit by one process per mailbox at once
+        semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+        async def fetch(actual_mailbox: str, account: str) -> list[EmailMessage]:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    get_messages_metadata,
+                    mailbox=actual_mailbox,
+                    account=account,
+                    limit=20,
+                    unread_only=False,
+                )
 
-                try:
-                    logger = get_account_logger(account)
-                    logger.info(f"Fetching up to 20 emails from {actual_mailbox}")
-                    messages = get_messages_metadata(
-                        mailbox=actual_mailbox,
-                        account=account,
-                        limit=20,
-                        unread_only=False,
-                    )
-                    logger.info(f"Fetched {len(messages)} emails from {actual_mailbox}")
+        for actual_mailbox, account in sources:
+            get_account_logger(account).info(f"Fetching up to 20 emails from {actual_mailbox}")
+        fetched = await asyncio.gather(
+            *(fetch(actual_mailbox, account) for actual_mailbox, account in sources),
+            return_exceptions=True,
+        )
 
-                    for msg in messages:
-                        if msg.mailbox in VIRTUAL_MAILBOXES or msg.mailbox.startswith("[Gmail]"):
-                            msg.mailbox = actual_mailbox
+        # gather() returns one result per source, in order
+        for (actual_mailbox, account), messages in zip(sources, fetched, strict=True):
+            logger = get_account_logger(account)
+            if isinstance(messages, BaseException):
+                logger.error(f"Failed to fetch from {actual_mailbox}: {messages}")
+                console.print(
+                    f"[yellow]Warning: Failed to fetch from {actual_mailbox}"
+                    f"{f' ({account})' if account else ''}:[/yellow] {messages}"
+                )
+                continue
 
-                        if msg.id in processed_ids or msg.id in self._processed_this_run:
-                            continue
-                        if msg.date_received and msg.date_received < cutoff_date:
-                            continue
-                        if self._is_excluded(msg):
-                            continue
+            logger.info(f"Fetched {len(messages)} emails from {actual_mailbox}")
 
-                        queue.append(msg)
+            for msg in messages:
+                if msg.mailbox in VIRTUAL_MAILBOXES or msg.mailbox.startswith("[Gmail]"):
+                    msg.mailbox = actual_mailbox
 
-                except Exception as e:
-                    logger = get_account_logger(account)
-                    logger.error(f"Failed to fetch from {actual_mailbox}: {e}")
-                    console.print(
-                        f"[yellow]Warning: Failed to fetch from {actual_mailbox}"
-                        f"{f' ({account})' if account else ''}:[/yellow] {e}"
-                    )
+                if msg.id in processed_ids or msg.id in self._processed_this_run:
+                    continue
+                if msg.date_received and msg.date_received < cutoff_date:
+                    continue
+                if self._is_excluded(msg):
+                    continue
+
+                queue.append(msg)
 
         # Sort newest first across all accounts
         queue.sort(key=lambda e: e.date_received or datetime.min, reverse=True)
@@ -456,7 +476,7 @@ class AutopilotEngine(
         """Process a single email through autopilot."""
         logger = get_account_logger(email.account)
         subject_short = email.subject[:60] if email.subject else "(no subject)"
-        logger.info(f"Processing: \"{subject_short}\" from {email.sender}")
+        logger.info('Processing: "%s" from %s', subject_short, email.sender)
 
         # Track first-seen for inbox aging (only if aging is enabled)
         if self.config.inbox_aging_enabled and not dry_run:
@@ -468,7 +488,7 @@ class AutopilotEngine(
             if quick_result.rule_matched:
                 action_str = quick_result.action or "unknown"
                 folder_str = f" -> {quick_result.target_folder}" if quick_result.target_folder else ""
-                logger.info(f"Quick rule \"{quick_result.rule_matched}\": {action_str.upper()}{folder_str}")
+                logger.info('Quick rule "%s": %s%s', quick_result.rule_matched, action_str.upper(), folder_str)
             return quick_result
 
         # No quick rule matched - use AI
@@ -539,8 +559,10 @@ class AutopilotEngine(
 
             folder_str = f" -> {decision.target_folder}" if decision.target_folder else ""
             logger.info(
-                f"AI decision: {decision.action.value.upper()}{folder_str} "
-                f"(confidence: {decision.confidence:.0%})"
+                "AI decision: %s%s (confidence: %.0f%%)",
+                decision.action.value.upper(),
+                folder_str,
+                decision.confidence * 100,
             )
         except Exception as e:
             # Track failure count for retry logic
@@ -729,6 +751,9 @@ class AutopilotEngine(
         if verbose >= 1:
             console.print(f"\n[bold]Checking {len(pending)} pending folder(s)...[/bold]\n")
 
+        # One query for every waiting action instead of one per resolved folder
+        actions_by_folder = self.db.get_actions_by_folder(account=account)
+
         for item in pending:
             folder = item["pending_folder"]
             pending_account = item["pending_account"]
@@ -741,12 +766,8 @@ class AutopilotEngine(
                 self._load_mailbox_cache(pending_account)
                 mailbox_list = self.mailbox_cache
 
-            # Check if folder now exists
-            folder_exists = any(
-                f.lower() == folder.lower() for f in mailbox_list
-            )
-
-            if not folder_exists:
+            # Check if folder now exists (case-insensitive)
+            if not mailbox_exists(folder, mailbox_list):
                 if verbose >= 2:
                     console.print(
                         f"[dim]  ✗ \"{folder}\" ({pending_account}) "
@@ -762,8 +783,7 @@ class AutopilotEngine(
                     f"- found! Processing {item['message_count']} pending action(s)...[/green]"
                 )
 
-            # Get all pending actions for this folder
-            actions = self.db.get_actions_for_folder(folder, pending_account)
+            actions = actions_by_folder.get((folder, pending_account), [])
 
             for action_record in actions:
                 try:
@@ -846,6 +866,8 @@ class AutopilotEngine(
 
         # Execute with interactive=True since user is actively approving
         result = await self._execute_action(email, decision, dry_run=False, interactive=True)
+        # There is no chunk boundary here, so run any move the action queued
+        self._flush_pending_moves()
 
         # Update pending status
         if result.success:
@@ -16,6 +16,7 @@ from email_nurse.mail.actions import (
     find_similar_mailbox,
     get_all_mailboxes,
     get_local_mailboxes,
+    mailbox_exists,
 )
 from email_nurse.mail.accounts import get_accounts
 
@@ -250,11 +251,7 @@ class FolderManagerMixin:
             mailbox_list = self.mailbox_cache
 
         # Check if folder exists in cache (case-insensitive)
-        folder_exists = any(
-            f.lower() == target_folder.lower() for f in mailbox_list
-        )
-
-        if folder_exists:
+        if mailbox_exists(target_folder, mailbox_list):
             return None  # Continue with action
 
         # Folder doesn't exist - find similar
@@ -527,10 +527,10 @@ class DailyReportGenerator:
         Returns:
             True if email was sent successfully, False otherwise.
         """
-        from email_nurse.config import Settings
+        from email_nurse.config import get_settings
         from email_nurse.mail.actions import compose_email, send_email_smtp
 
-        settings = Settings()
+        settings = get_settings()
 
         # Get activity data and PIM context for both plain text and HTML formatting
         activity = self.db.get_daily_activity(report_date)
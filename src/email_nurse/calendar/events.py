@@ -117,7 +117,7 @@ def get_events(
         cal_escaped = escape_applescript_string(calendar_name)
         script = f'''
         tell application "Calendar"
-            set output to ""
+            set output to {{}}
             set RS to (ASCII character 30)  -- Record Separator
             set US to (ASCII character 31)  -- Unit Separator
             set eventCount to 0
@@ -160,18 +160,20 @@ def get_events(
                 if evtUrl is "" then set evtUrl to "-"
                 if evtRecurrence is "" then set evtRecurrence to "-"
 
-                if output is not "" then set output to output & RS
-                set output to output & evtId & US & evtSummary & US & evtDesc & US & evtLocation & US & evtStart & US & evtEnd & US & (evtAllDay as string) & US & "{cal_escaped}" & US & evtUrl & US & evtRecurrence
+                copy (evtId & US & evtSummary & US & evtDesc & US & evtLocation & US & evtStart & US & evtEnd & US & (evtAllDay as string) & US & "{cal_escaped}" & US & evtUrl & US & evtRecurrence) to end of output
             end repeat
 
-            return output
+            -- Records are collected in a list and joined once; appending to
+            -- a growing string copies it on every event
+            set AppleScript's text item delimiters to RS
+            return output as text
         end tell
         '''
     else:
         # All calendars - iterate through each
         script = f'''
         tell application "Calendar"
-            set output to ""
+            set output to {{}}
             set RS to (ASCII character 30)  -- Record Separator
             set US to (ASCII character 31)  -- Unit Separator
             set eventCount to 0
@@ -217,12 +219,14 @@ def get_events(
                     if evtUrl is "" then set evtUrl to "-"
                     if evtRecurrence is "" then set evtRecurrence to "-"
 
-                    if output is not "" then set output to output & RS
-                    set output to output & evtId & US & evtSummary & US & evtDesc & US & evtLocation & US & evtStart & US & evtEnd & US & (evtAllDay as string) & US & calName & US & evtUrl & US & evtRecurrence
+                    copy (evtId & US & evtSummary & US & evtDesc & US & evtLocation & US & evtStart & US & evtEnd & US & (evtAllDay as string) & US & calName & US & evtUrl & US & evtRecurrence) to end of output
                 end repeat
             end repeat
 
-            return output
+            -- Records are collected in a list and joined once; appending to
+            -- a growing string copies it on every event
+            set AppleScript's text item delimiters to RS
+            return output as text
         end tell
         '''
 
@@ -238,8 +242,8 @@ def get_events(
 
     events = []
     for record in result.split(RECORD_SEP):
-        parts = record.split(UNIT_SEP)
-        if len(parts) >= 10:
+        parts = record.split(UNIT_SEP, 9)
+        if len(parts) == 10:
             events.append(
                 CalendarEvent(
                     id=parts[0],
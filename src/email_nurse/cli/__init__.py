@@ -1,125 +1,198 @@
 """Command-line interface for email-nurse."""
 
-import asyncio
+import os
+import sys
+from collections.abc import Iterable
+from functools import lru_cache
+from importlib import import_module
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Any
 
 import typer
 from rich.console import Console
 
-from email_nurse.config import Settings
+if TYPE_CHECKING:
+    from rich.console import RenderableType
+    from rich.table import Table
 
-app = typer.Typer(
+    from email_nurse.ai.base import AIProvider
+    from email_nurse.config import Settings
+    from email_nurse.storage.database import AutopilotDatabase
+
+_app = typer.Typer(
     name="email-nurse",
     help="AI-powered email management for macOS Mail.app",
     no_args_is_help=True,
+    rich_markup_mode=None,
 )
-console = Console()
+
+
+def _make_console() -> Console:
+    """Create the shared console, skipping highlighting when output is piped.
+
+    Markup stays enabled so style tags are stripped rather than printed.
+    """
+    if not sys.stdout.isatty():
+        return Console(no_color=True, highlight=False, emoji=False, soft_wrap=True)
+    return Console()
+
+
+console = _make_console()
 
 # Sub-command groups
-accounts_app = typer.Typer(help="Manage email accounts")
-messages_app = typer.Typer(help="View and process messages")
-autopilot_app = typer.Typer(help="Autopilot mode operations")
-reminders_app = typer.Typer(help="Apple Reminders integration")
-calendar_app = typer.Typer(help="Apple Calendar integration")
-ops_app = typer.Typer(help="Ops: self-healing and maintenance")
-
-app.add_typer(accounts_app, name="accounts")
-app.add_typer(messages_app, name="messages")
-app.add_typer(autopilot_app, name="autopilot")
-app.add_typer(reminders_app, name="reminders")
-app.add_typer(calendar_app, name="calendar")
-app.add_typer(ops_app, name="ops")
-
-
-def get_settings() -> Settings:
-    """Load application settings."""
-    return Settings()
-
-
-@app.command()
-def version() -> None:
-    """Show version information."""
-    from email_nurse import __version__
-
-    console.print(f"email-nurse v{__version__}")
-
-
-@app.command()
-def init(
-    config_dir: Annotated[
-        Path | None,
-        typer.Option("--config-dir", "-c", help="Configuration directory"),
-    ] = None,
-) -> None:
-    """Initialize configuration directory with example files."""
-    settings = get_settings()
-    if config_dir:
-        settings.config_dir = config_dir
-
-    settings.ensure_config_dir()
-
-    # Create example templates file if it doesn't exist
-    if not settings.templates_path.exists():
-        example_templates = """# Email Nurse Reply Templates
-# Templates can be static text or AI instructions
-
-templates:
-  acknowledge:
-    description: "Simple acknowledgment reply"
-    use_ai: true
-    content: |
-      Generate a brief, professional acknowledgment of this email.
-      Thank the sender and indicate the message has been received.
-      Keep it under 3 sentences.
-
-  out_of_office:
-    description: "Out of office auto-reply"
-    use_ai: false
-    content: |
-      Thank you for your email. I am currently out of the office
-      and will respond to your message when I return.
-
-      Best regards
-
-  follow_up:
-    description: "Request more information"
-    use_ai: true
-    content: |
-      Generate a polite reply asking for clarification or more details
-      about the main topic of this email. Be specific about what
-      additional information would be helpful.
-"""
-        settings.templates_path.write_text(example_templates)
-        console.print(f"[green]Created[/green] {settings.templates_path}")
-
-    console.print(f"\n[bold]Configuration initialized at:[/bold] {settings.config_dir}")
-
-
-@app.command()
-def run(
-    once: Annotated[bool, typer.Option("--once", help="Run once then exit")] = False,
-    dry_run: Annotated[bool, typer.Option("--dry-run", "-n", help="Don't execute actions")] = True,
-) -> None:
-    """Run the email processing daemon."""
-    console.print("[bold]Email Nurse[/bold] starting...")
-    console.print(f"  Dry run: {'Yes' if dry_run else 'No'}")
-
-    if once:
-        console.print("\n[yellow]Single run mode - not implemented[/yellow]")
-        console.print("[dim]Use 'email-nurse autopilot run' instead[/dim]")
-    else:
-        console.print("\n[yellow]Daemon mode not yet implemented[/yellow]")
-        console.print("Use --once for single run")
-
-
-# Import sub-modules to trigger command registration
-from email_nurse.cli import accounts  # noqa: E402, F401
-from email_nurse.cli import messages  # noqa: E402, F401
-from email_nurse.cli import autopilot  # noqa: E402, F401
-from email_nurse.cli import reminders  # noqa: E402, F401
-from email_nurse.cli import calendar  # noqa: E402, F401
-from email_nurse.cli import ops  # noqa: E402, F401
+accounts_app = typer.Typer(help="Manage email accounts", rich_markup_mode=None)
+messages_app = typer.Typer(help="View and process messages", rich_markup_mode=None)
+autopilot_app = typer.Typer(help="Autopilot mode operations", rich_markup_mode=None)
+reminders_app = typer.Typer(help="Apple Reminders integration", rich_markup_mode=None)
+calendar_app = typer.Typer(help="Apple Calendar integration", rich_markup_mode=None)
+ops_app = typer.Typer(help="Ops: self-healing and maintenance", rich_markup_mode=None)
+
+_app.add_typer(accounts_app, name="accounts")
+_app.add_typer(messages_app, name="messages")
+_app.add_typer(autopilot_app, name="autopilot")
+_app.add_typer(reminders_app, name="reminders")
+_app.add_typer(calendar_app, name="calendar")
+_app.add_typer(ops_app, name="ops")
+
+
+def get_settings() -> "Settings":
+    """Load application settings once per process."""
+    from email_nurse.config import get_settings as load_settings
+
+    return load_settings()
+
+
+@lru_cache(maxsize=4)
+def get_database(db_path: Path) -> "AutopilotDatabase":
+    """Open the autopilot database, reusing one instance per path in this process."""
+    from email_nurse.storage.database import AutopilotDatabase
+
+    return AutopilotDatabase(db_path)
+
+
+def get_ai_provider(settings: "Settings", provider: str) -> "AIProvider":
+    """Create the named AI provider, exiting with an error if it is unknown."""
+    from email_nurse.ai.factory import create_ai_provider
+
+    try:
+        return create_ai_provider(settings, provider)
+    except ValueError:
+        console.print(f"[red]Unknown provider:[/red] {provider}")
+        raise typer.Exit(1) from None
+
+
+# Tabs and line breaks inside cells would split TSV fields and records
+_TSV_UNSAFE = str.maketrans("\t\r\n", "   ")
+
+# A column schema is a sequence of (header, add_column keyword arguments)
+ColumnSchema = tuple[tuple[str, dict[str, Any]], ...]
+
+
+def make_table(title: str, columns: ColumnSchema) -> "Table":
+    """Build a Rich table from a module-level column schema."""
+    from rich.table import Table
+
+    table = Table(title=title)
+    for header, options in columns:
+        table.add_column(header, **options)
+    return table
+
+
+def clip(value: str, width: int) -> str:
+    """Shorten a table cell on the terminal; piped output keeps the full value."""
+    return value[:width] if console.is_terminal else value
+
+
+def stream_table(table: "Table", rows: Iterable[tuple["RenderableType", ...]]) -> None:
+    """Render a table live, adding each row as soon as the iterable yields it.
+
+    Piped output skips Rich entirely and is written as tab-separated lines,
+    headers first, so scripts get one record per line. Use clip() for cells
+    that are shortened to fit the terminal.
+    """
+    if not console.is_terminal:
+        write = console.file.write
+        write("\t".join(str(column.header) for column in table.columns) + "\n")
+        for row in rows:
+            write("\t".join(str(cell).translate(_TSV_UNSAFE) for cell in row) + "\n")
+        return
+
+    from rich.live import Live
+
+    with Live(table, console=console, refresh_per_second=12):
+        for row in rows:
+            table.add_row(*row)
+
+
+# Command modules registered per sub-command group. The first module of each
+# group holds its everyday commands; any others hold rarely used ones.
+_GROUP_MODULES: dict[str, tuple[str, ...]] = {
+    "accounts": ("accounts",),
+    "messages": ("messages",),
+    "autopilot": ("autopilot", "autopilot_admin"),
+    "reminders": ("reminders",),
+    "calendar": ("calendar",),
+    "ops": ("ops",),
+}
+
+# Rarely used commands that live outside their group's first module
+_RARE_COMMANDS: dict[tuple[str, str], str] = {
+    ("autopilot", "init"): "autopilot_admin",
+    ("autopilot", "add-rule"): "autopilot_admin",
+    ("autopilot", "reset"): "autopilot_admin",
+    ("autopilot", "reset-watcher"): "autopilot_admin",
+    ("autopilot", "clear-cache"): "autopilot_admin",
+}
+
+
+def _modules_for_argv(argv: list[str]) -> list[str]:
+    """Pick the command modules needed to dispatch argv.
+
+    Help output, shell completion, top-level commands, and anything
+    unrecognized get every module so listings stay complete.
+    """
+    everything = ["general", *(m for mods in _GROUP_MODULES.values() for m in mods)]
+    if not argv or "_EMAIL_NURSE_COMPLETE" in os.environ:
+        return everything
+
+    group = argv[0]
+    modules = _GROUP_MODULES.get(group)
+    if modules is None:
+        return everything
+
+    if len(argv) < 2 or argv[1].startswith("-"):
+        return list(modules)
+    return [_RARE_COMMANDS.get((group, argv[1]), modules[0])]
+
+
+_registered: set[str] = set()
+
+
+def _register_commands(modules: list[str]) -> None:
+    """Import command modules; their decorators register with the apps above."""
+    for module in modules:
+        if module not in _registered:
+            _registered.add(module)
+            import_module(f"email_nurse.cli.{module}")
+
+
+def __getattr__(name: str) -> typer.Typer:
+    """Hand out the root app with every command registered.
+
+    Importers of ``app`` (tests, embedding scripts) may run any command with
+    their own argv, so they get the full tree; only main() trims it.
+    """
+    if name == "app":
+        _register_commands(_modules_for_argv([]))
+        return _app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def main() -> None:
+    """Console-script entry point: register only the commands argv needs."""
+    _register_commands(_modules_for_argv(sys.argv[1:]))
+    _app()
+
 
 if __name__ == "__main__":
-    app()
+    main()
@@ -3,9 +3,19 @@
 from typing import Annotated
 
 import typer
-from rich.table import Table
+from rich.text import Text
 
-from email_nurse.cli import accounts_app, console
+from email_nurse.cli import ColumnSchema, accounts_app, console, make_table
+
+_ACCOUNT_COLUMNS: ColumnSchema = (
+    ("Name", {"style": "cyan"}),
+    ("Email Addresses", {"style": "green"}),
+    ("Type", {"style": "blue"}),
+    ("Enabled", {"style": "yellow"}),
+)
+
+# Prebuilt Enabled cells, so rows skip markup parsing
+_ENABLED_CELLS = {True: Text("✓"), False: Text("✗")}
 
 
 @accounts_app.command("list")
@@ -23,18 +33,14 @@ def accounts_list() -> None:
         console.print("[yellow]No email accounts found in Mail.app[/yellow]")
         return
 
-    table = Table(title="Email Accounts")
-    table.add_column("Name", style="cyan")
-    table.add_column("Email Addresses", style="green")
-    table.add_column("Type", style="blue")
-    table.add_column("Enabled", style="yellow")
+    table = make_table("Email Accounts", _ACCOUNT_COLUMNS)
 
     for acct in accounts:
         table.add_row(
             acct.name,
             ", ".join(acct.email_addresses),
             acct.account_type,
-            "✓" if acct.enabled else "✗",
+            _ENABLED_CELLS[bool(acct.enabled)],
         )
 
     console.print(table)
@@ -42,18 +48,21 @@ def accounts_list() -> None:
 
 @accounts_app.command("sync")
 def accounts_sync(
-    account: Annotated[
-        str | None,
-        typer.Argument(help="Account name to sync (all if not specified)"),
+    accounts: Annotated[
+        list[str] | None,
+        typer.Argument(help="Account name(s) to sync (all if not specified)"),
     ] = None,
 ) -> None:
     """Trigger sync/check for new mail."""
-    from email_nurse.mail.accounts import sync_account, sync_all_accounts
+    from email_nurse.mail.accounts import sync_account, sync_accounts, sync_all_accounts
 
     try:
-        if account:
-            console.print(f"Syncing account: {account}")
-            sync_account(account)
+        if accounts and len(accounts) == 1:
+            console.print(f"Syncing account: {accounts[0]}")
+            sync_account(accounts[0])
+        elif accounts:
+            console.print(f"Syncing accounts: {', '.join(accounts)}")
+            sync_accounts(accounts)
         else:
             console.print("Syncing all accounts...")
             sync_all_accounts()
@@ -0,0 +1,384 @@
+"""Rarely used autopilot commands: setup, rule editing, and state resets.
+
+Kept apart from the main autopilot module so routine invocations such as
+``autopilot run`` skip registering them. See ``_register_commands`` in
+``email_nurse.cli``.
+"""
+
+import asyncio
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated
+
+import typer
+
+from email_nurse.cli import autopilot_app, console, get_database, get_settings
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from email_nurse.autopilot.config import QuickRule
+
+_QUICK_RULES_SECTION = re.compile(rb"^[ \t]*quick_rules:", re.MULTILINE)
+# Top-level YAML lines: not blank, indented (spaces or tabs), or a comment
+_TOP_LEVEL_LINE = re.compile(rb"^[^ \t#\r\n]", re.MULTILINE)
+
+# Rule descriptions parsed by the AI at once, to stay within rate limits
+PARSE_CONCURRENCY = 4
+
+
+@autopilot_app.command("init")
+def autopilot_init() -> None:
+    """Initialize autopilot configuration."""
+    settings = get_settings()
+    settings.ensure_config_dir()
+
+    from importlib.resources import files
+
+    example_config = files("email_nurse.templates").joinpath("example_autopilot.yaml").read_bytes()
+
+    # Exclusive create: only an existing file leads to the overwrite prompt
+    try:
+        with settings.autopilot_config_path.open("xb") as f:
+            f.write(example_config)
+    except FileExistsError:
+        console.print(f"[yellow]Autopilot config already exists:[/yellow] {settings.autopilot_config_path}")
+        overwrite = typer.confirm("Overwrite with example?", default=False)
+        if not overwrite:
+            return
+        settings.autopilot_config_path.write_bytes(example_config)
+
+    console.print(f"[green]Created[/green] {settings.autopilot_config_path}")
+    console.print("\nEdit this file with your instructions, then run:")
+    console.print("  [bold]email-nurse autopilot run --dry-run -v[/bold]")
+
+
+@autopilot_app.command("add-rule")
+def autopilot_add_rule(
+    description: Annotated[
+        str | None,
+        typer.Argument(help="Natural language rule description"),
+    ] = None,
+    name: Annotated[
+        str | None,
+        typer.Option("--name", "-n", help="Explicit name for the rule"),
+    ] = None,
+    from_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--from-file",
+            "-f",
+            help="Read rule descriptions from a file, one per line",
+            exists=True,
+            dir_okay=False,
+        ),
+    ] = None,
+    yes: Annotated[
+        bool,
+        typer.Option("--yes", "-y", help="Skip confirmation prompt"),
+    ] = False,
+) -> None:
+    """Add a quick rule from natural language description.
+
+    \b
+    Examples:
+        email-nurse autopilot add-rule "move anything from spam@example.com to Junk"
+        email-nurse autopilot add-rule "delete all emails from @sketchy.biz"
+        email-nurse autopilot add-rule "ignore newsletters with 'unsubscribe' in subject"
+        email-nurse autopilot add-rule "mark read and trash marketing from acme.com"
+        email-nurse autopilot add-rule --from-file rules.txt
+
+    Run without arguments for interactive mode with full instructions.
+    With --from-file, blank lines and lines starting with # are skipped and
+    all descriptions are parsed concurrently.
+    """
+    from rich.panel import Panel
+
+    from email_nurse.ai.claude import ClaudeProvider
+    from email_nurse.autopilot.config import QuickRule
+
+    settings = get_settings()
+
+    if from_file is not None:
+        if description is not None or name is not None:
+            console.print("[red]Error: --from-file cannot be combined with a description or --name.[/red]")
+            raise typer.Exit(1)
+
+        descriptions = [
+            line.strip()
+            for line in from_file.read_text().splitlines()
+            if line.strip() and not line.lstrip().startswith("#")
+        ]
+        if not descriptions:
+            console.print("[yellow]No rule descriptions found in file. Cancelled.[/yellow]")
+            raise typer.Exit(0)
+    else:
+        # Interactive mode if no description provided
+        if description is None:
+            examples = """[cyan]Describe the rule you want to create in plain English.[/cyan]
+
+[dim]Examples:[/dim]
+  • "move emails from bob@example.com to Archive"
+  • "delete anything from @spam-domain.com"
+  • "ignore newsletters with 'unsubscribe' in subject"
+  • "mark read and trash marketing from acme.com\""""
+
+            console.print(Panel(examples, title="Quick Rule Generator", border_style="blue"))
+            console.print()
+
+            description = typer.prompt("Enter rule description")
+            if not description.strip():
+                console.print("[yellow]No description provided. Cancelled.[/yellow]")
+                raise typer.Exit(0)
+
+        descriptions = [description]
+
+    # Initialize Claude provider for parsing
+    if not settings.anthropic_api_key:
+        console.print("[red]Error: ANTHROPIC_API_KEY not set.[/red]")
+        console.print("Set the environment variable or configure it in settings.")
+        raise typer.Exit(1)
+
+    ai = ClaudeProvider(
+        api_key=settings.anthropic_api_key,
+        prompt_cache=settings.anthropic_prompt_cache_enabled,
+    )
+
+    batch = len(descriptions) > 1
+    if batch:
+        console.print(f"\n[dim]Parsing {len(descriptions)} rules with AI...[/dim]")
+    else:
+        console.print("\n[dim]Parsing with AI...[/dim]")
+
+    # Parse every description into a QuickRule in one event loop, sharing
+    # the provider's client (and its pooled connections) across requests;
+    # a few run at a time so large --from-file batches avoid 429s
+    semaphore = asyncio.Semaphore(PARSE_CONCURRENCY)
+
+    async def parse_one(desc: str) -> QuickRule:
+        async with semaphore:
+            return await ai.parse_quick_rule(desc, rule_name=name)
+
+    async def parse_rules() -> list[QuickRule | BaseException]:
+        async with ai:
+            return await asyncio.gather(
+                *(parse_one(desc) for desc in descriptions),
+                return_exceptions=True,
+            )
+
+    # gather() returns one result per description, in order
+    rules: list[QuickRule] = []
+    for desc, result in zip(descriptions, asyncio.run(parse_rules()), strict=True):
+        if isinstance(result, BaseException):
+            if batch:
+                console.print(f"\n[dim]{desc}[/dim]")
+            _print_parse_error(result)
+        else:
+            rules.append(result)
+
+    if not rules:
+        raise typer.Exit(1)
+
+    # Display the generated rules
+    console.print("\n[bold]Generated Rules:[/bold]" if batch else "\n[bold]Generated Rule:[/bold]")
+    for rule in rules:
+        # Show exactly the YAML that will be written
+        console.print(rule.to_yaml_block(), markup=False, highlight=False, end="\n\n")
+
+    # Confirm unless --yes
+    if not yes:
+        prompt = f"Add these {len(rules)} rules?" if len(rules) > 1 else "Add this rule?"
+        if not typer.confirm(prompt, default=True):
+            console.print("[yellow]Cancelled.[/yellow]")
+            raise typer.Exit(0)
+
+    # Append to config files: production (if present) and the repo copy
+    # (deploy/config/autopilot.yaml), unless both are the same file
+    production_config = settings.autopilot_config_path
+    targets = []
+    if production_config.exists():
+        targets.append(production_config)
+    repo_config = _repo_config_path()
+    if repo_config is not None and not _same_file(repo_config, production_config):
+        targets.append(repo_config)
+
+    # The two files are independent, so write them concurrently
+    async def write_configs() -> list[BaseException | None]:
+        return await asyncio.gather(
+            *(asyncio.to_thread(_append_quick_rules_to_config, path, rules) for path in targets),
+            return_exceptions=True,
+        )
+
+    noun = f"{len(rules)} rules" if len(rules) > 1 else "Rule"
+    production_failed = False
+    # gather() returns one result per target, in order
+    for path, error in zip(targets, asyncio.run(write_configs()), strict=True):
+        if error is None:
+            console.print(f"[green]✓ {noun} added to[/green] {path}")
+        elif path == production_config:
+            console.print(f"[red]Failed to update production config:[/red] {error}")
+            production_failed = True
+        else:
+            console.print(f"[yellow]Warning: Failed to update repo config:[/yellow] {error}")
+
+    if production_failed:
+        raise typer.Exit(1)
+
+
+def _print_parse_error(error: BaseException) -> None:
+    """Report a failed rule parse, calling out authentication problems."""
+    if isinstance(error, ValueError):
+        console.print(f"[red]Failed to parse rule:[/red] {error}")
+        return
+
+    # API errors (authentication, rate limits, etc.)
+    error_msg = str(error)
+    if "401" in error_msg or "authentication" in error_msg.lower():
+        console.print("[red]Authentication failed.[/red]")
+        console.print("Please verify your ANTHROPIC_API_KEY is correct.")
+        console.print("Check: ~/.config/email-nurse/.env")
+    else:
+        console.print(f"[red]API error:[/red] {error}")
+
+
+@lru_cache(maxsize=1)
+def _repo_config_path() -> Path | None:
+    """Return deploy/config/autopilot.yaml under the working directory, if present."""
+    path = Path.cwd() / "deploy" / "config" / "autopilot.yaml"
+    return path if path.exists() else None
+
+
+def _same_file(a: Path, b: Path) -> bool:
+    """Whether two paths name the same file, following symlinks."""
+    try:
+        return a.samefile(b)
+    except OSError:
+        # Either path is missing, so they cannot be the same existing file
+        return False
+
+
+def _append_quick_rules_to_config(config_path: Path, rules: "Iterable[QuickRule]") -> None:
+    """Append quick rules to autopilot.yaml preserving formatting.
+
+    This function carefully appends new rules to the quick_rules section
+    of the YAML config file while preserving comments and existing formatting.
+    All rules go in with a single write. Only the bytes after the insertion
+    point are written; when quick_rules is the last section (or missing) the
+    rules are simply appended.
+    """
+    rule_block = "\n".join(f"\n{rule.to_yaml_block()}" for rule in rules).encode()
+
+    with config_path.open("r+b") as f:
+        content = f.read()
+
+        section = _QUICK_RULES_SECTION.search(content)
+        if section is None:
+            # No quick_rules section exists - add one
+            f.write(b"\n\nquick_rules:" + rule_block)
+            return
+
+        next_section = _TOP_LEVEL_LINE.search(content, section.end())
+        if next_section is None:
+            # quick_rules is the last section - plain append at the end
+            f.write(b"\n" + rule_block)
+            return
+
+        # Insert before the next top-level section, rewriting only what follows it
+        insert = next_section.start()
+        f.seek(insert)
+        f.write(rule_block + b"\n" + content[insert:])
+
+
+@autopilot_app.command("reset")
+def autopilot_reset(
+    older_than: int = typer.Option(
+        None,
+        "--older-than",
+        "-o",
+        help="Only clear entries older than N days (default: all)",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        "-f",
+        help="Skip confirmation prompt",
+    ),
+) -> None:
+    """Reset processed email tracking to re-analyze messages."""
+    settings = get_settings()
+
+    if not settings.database_path.exists():
+        console.print("[yellow]No database found - nothing to reset.[/yellow]")
+        return
+
+    db = get_database(settings.database_path)
+
+    # The count only feeds the confirmation prompt; clear_processed reports
+    # the number of deleted rows itself
+    if not force:
+        current_count = db.get_processed_count()
+        if current_count == 0:
+            console.print("[yellow]No processed emails to clear.[/yellow]")
+            return
+
+        # Describe what will happen
+        if older_than:
+            desc = f"entries older than {older_than} days"
+        else:
+            desc = f"all {current_count} entries"
+
+        confirm = typer.confirm(f"Clear {desc} from processed tracking?")
+        if not confirm:
+            console.print("Cancelled.")
+            return
+
+    cleared = db.clear_processed(before_days=older_than)
+    if cleared == 0:
+        console.print("[yellow]No processed emails to clear.[/yellow]")
+        return
+
+    console.print(f"[green]✓ Cleared {cleared} processed email records.[/green]")
+    console.print("Next autopilot run will re-analyze these messages.")
+
+
+@autopilot_app.command("reset-watcher")
+def autopilot_reset_watcher() -> None:
+    """Reset watcher state (clears stale PID lock and counters)."""
+    settings = get_settings()
+
+    if not settings.database_path.exists():
+        console.print("[yellow]No database found - nothing to reset.[/yellow]")
+        return
+
+    db = get_database(settings.database_path)
+    cleared = db.clear_watcher_state()
+
+    if cleared > 0:
+        console.print(f"[green]✓ Cleared watcher state ({cleared} entries).[/green]")
+    else:
+        console.print("[yellow]No watcher state to clear.[/yellow]")
+
+
+@autopilot_app.command("clear-cache")
+def autopilot_clear_cache(
+    account: Annotated[
+        str | None,
+        typer.Option("--account", "-a", help="Clear cache for specific account only"),
+    ] = None,
+) -> None:
+    """Clear cached mailbox lists (forces fresh fetch from Mail.app)."""
+    settings = get_settings()
+
+    if not settings.database_path.exists():
+        console.print("[yellow]No database found - nothing to clear.[/yellow]")
+        return
+
+    db = get_database(settings.database_path)
+    cleared = db.clear_mailbox_cache(account=account)
+
+    if cleared > 0:
+        target = f"for {account}" if account else "for all accounts"
+        console.print(f"[green]✓ Cleared mailbox cache {target}.[/green]")
+    else:
+        console.print("[yellow]No cached mailboxes to clear.[/yellow]")
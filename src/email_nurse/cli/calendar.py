@@ -3,7 +3,6 @@
 from typing import Annotated
 
 import typer
-from rich.table import Table
 
 from email_nurse.cli import calendar_app, console
 
@@ -11,6 +10,8 @@ from email_nurse.cli import calendar_app, console
 @calendar_app.command("list")
 def calendar_list() -> None:
     """List all calendars from Calendar.app."""
+    from rich.table import Table
+
     from email_nurse.calendar import get_calendars
     from email_nurse.calendar.calendars import CalendarAppNotRunningError
 
@@ -49,6 +50,7 @@ def calendar_events(
 ) -> None:
     """Show upcoming events.
 
+    \b
     Examples:
         email-nurse calendar events                     # Next 30 days, all calendars
         email-nurse calendar events --days 7           # Next 7 days
@@ -57,6 +59,8 @@ def calendar_events(
     """
     from datetime import datetime, timedelta
 
+    from rich.table import Table
+
     from email_nurse.calendar import get_events
     from email_nurse.calendar.calendars import CalendarAppNotRunningError
 
@@ -113,10 +117,13 @@ def calendar_today(
 ) -> None:
     """Show today's events.
 
+    \b
     Examples:
         email-nurse calendar today           # All calendars
         email-nurse calendar today -c Work   # Only Work calendar
     """
+    from rich.table import Table
+
     from email_nurse.calendar import get_events_today
     from email_nurse.calendar.calendars import CalendarAppNotRunningError
 
@@ -168,6 +175,7 @@ def calendar_create(
 ) -> None:
     """Create a calendar event.
 
+    \b
     Examples:
         email-nurse calendar create "Team meeting" --start "2026-01-15 14:00"
         email-nurse calendar create "Lunch" -s "2026-01-20 12:00" -e "2026-01-20 13:00" -c Work
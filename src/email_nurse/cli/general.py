@@ -0,0 +1,61 @@
+"""Top-level email-nurse commands (version, init, run)."""
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from email_nurse.cli import app, console, get_settings
+
+
+@app.command()
+def version() -> None:
+    """Show version information."""
+    from email_nurse import __version__
+
+    console.print(f"email-nurse v{__version__}")
+
+
+@app.command()
+def init(
+    config_dir: Annotated[
+        Path | None,
+        typer.Option("--config-dir", "-c", help="Configuration directory"),
+    ] = None,
+) -> None:
+    """Initialize configuration directory with example files."""
+    from email_nurse.config import Settings
+
+    settings = Settings(config_dir=config_dir) if config_dir else get_settings()
+    settings.ensure_config_dir()
+
+    # Create example templates file if it doesn't exist ("x" fails if it does)
+    from importlib.resources import files
+
+    example_templates = files("email_nurse.templates").joinpath("example_templates.yaml")
+    try:
+        with settings.templates_path.open("xb") as f:
+            f.write(example_templates.read_bytes())
+    except FileExistsError:
+        pass
+    else:
+        console.print(f"[green]Created[/green] {settings.templates_path}")
+
+    console.print(f"\n[bold]Configuration initialized at:[/bold] {settings.config_dir}")
+
+
+@app.command()
+def run(
+    once: Annotated[bool, typer.Option("--once", help="Run once then exit")] = False,
+    dry_run: Annotated[bool, typer.Option("--dry-run", "-n", help="Don't execute actions")] = True,
+) -> None:
+    """Run the email processing daemon."""
+    console.print("[bold]Email Nurse[/bold] starting...")
+    console.print(f"  Dry run: {'Yes' if dry_run else 'No'}")
+
+    if once:
+        console.print("\n[yellow]Single run mode - not implemented[/yellow]")
+        console.print("[dim]Use 'email-nurse autopilot run' instead[/dim]")
+    else:
+        console.print("\n[yellow]Daemon mode not yet implemented[/yellow]")
+        console.print("Use --once for single run")
@@ -4,9 +4,25 @@ import asyncio
 from typing import Annotated
 
 import typer
-from rich.table import Table
 
-from email_nurse.cli import console, get_settings, messages_app
+from email_nurse.cli import (
+    ColumnSchema,
+    clip,
+    console,
+    get_ai_provider,
+    get_settings,
+    make_table,
+    messages_app,
+    stream_table,
+)
+
+_MESSAGE_COLUMNS: ColumnSchema = (
+    ("ID", {"style": "dim", "width": 8}),
+    ("From", {"style": "cyan", "max_width": 30}),
+    ("Subject", {"style": "green", "max_width": 50}),
+    ("Date", {"style": "blue", "width": 12}),
+    ("Read", {"width": 4}),
+)
 
 
 @messages_app.command("list")
@@ -17,10 +33,11 @@ def messages_list(
     unread: Annotated[bool, typer.Option("--unread", "-u", help="Only unread messages")] = False,
 ) -> None:
     """List messages in a mailbox."""
-    from email_nurse.mail.messages import get_messages
+    from email_nurse.mail.messages import get_messages_metadata
 
+    # The listing never shows bodies, so skip fetching them (sysm --with-content)
     try:
-        messages = get_messages(
+        messages = get_messages_metadata(
             mailbox=mailbox,
             account=account,
             limit=limit,
@@ -34,24 +51,20 @@ def messages_list(
         console.print("[yellow]No messages found[/yellow]")
         return
 
-    table = Table(title=f"Messages in {mailbox}")
-    table.add_column("ID", style="dim", width=8)
-    table.add_column("From", style="cyan", max_width=30)
-    table.add_column("Subject", style="green", max_width=50)
-    table.add_column("Date", style="blue", width=12)
-    table.add_column("Read", width=4)
-
-    for msg in messages:
-        date_str = msg.date_received.strftime("%m/%d %H:%M") if msg.date_received else "-"
-        table.add_row(
-            msg.id[:8],
-            msg.sender[:30],
-            msg.subject[:50],
-            date_str,
-            "✓" if msg.is_read else "",
-        )
-
-    console.print(table)
+    table = make_table(f"Messages in {mailbox}", _MESSAGE_COLUMNS)
+    stream_table(
+        table,
+        (
+            (
+                clip(msg.id, 8),
+                clip(msg.sender, 30),
+                clip(msg.subject, 50),
+                msg.date_received.strftime("%m/%d %H:%M") if msg.date_received else "-",
+                "✓" if msg.is_read else "",
+            )
+            for msg in messages
+        ),
+    )
 
 
 @messages_app.command("show")
@@ -61,7 +74,7 @@ def messages_show(
     """Show details of a specific message."""
     from email_nurse.mail.messages import get_message_by_id
 
-    msg = get_message_by_id(message_id)
+    msg = get_message_by_id(message_id, content_limit=2000)
     if not msg:
         console.print(f"[red]Message not found:[/red] {message_id}")
         raise typer.Exit(1)
@@ -74,7 +87,7 @@ def messages_show(
     console.print(f"[bold]Mailbox:[/bold] {msg.mailbox}")
     console.print(f"[bold]Read:[/bold] {'Yes' if msg.is_read else 'No'}")
     console.print("\n[bold]Content:[/bold]")
-    console.print(msg.content[:2000])
+    console.print(msg.content)
 
 
 @messages_app.command("classify")
@@ -83,28 +96,18 @@ def messages_classify(
     account: Annotated[str | None, typer.Option("--account", "-a")] = None,
     limit: Annotated[int, typer.Option("--limit", "-n")] = 5,
     provider: Annotated[str, typer.Option("--provider", "-p")] = "claude",
+    concurrency: Annotated[
+        int,
+        typer.Option("--concurrency", "-c", min=1, help="Max classifications in flight"),
+    ] = 5,
 ) -> None:
     """Classify messages using AI (dry run)."""
-    from email_nurse.mail.messages import get_messages
+    from email_nurse.ai.base import EmailClassification
+    from email_nurse.mail.messages import EmailMessage, get_messages
 
     settings = get_settings()
 
-    # Get AI provider
-    if provider == "claude":
-        from email_nurse.ai.claude import ClaudeProvider
-
-        ai = ClaudeProvider(api_key=settings.anthropic_api_key, model=settings.claude_model)
-    elif provider == "openai":
-        from email_nurse.ai.openai import OpenAIProvider
-
-        ai = OpenAIProvider(api_key=settings.openai_api_key, model=settings.openai_model)
-    elif provider == "ollama":
-        from email_nurse.ai.ollama import OllamaProvider
-
-        ai = OllamaProvider(host=settings.ollama_host, model=settings.ollama_model)
-    else:
-        console.print(f"[red]Unknown provider:[/red] {provider}")
-        raise typer.Exit(1)
+    ai = get_ai_provider(settings, provider)
 
     messages = get_messages(mailbox=mailbox, account=account, limit=limit, unread_only=True)
 
@@ -114,17 +117,33 @@ def messages_classify(
 
     console.print(f"\n[bold]Classifying {len(messages)} messages with {provider}...[/bold]\n")
 
-    async def classify_all():
-        for msg in messages:
-            console.print(f"[cyan]{msg.subject[:60]}[/cyan]")
+    # Bound in-flight requests to stay within provider rate limits
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def classify_one(msg: EmailMessage) -> EmailClassification | Exception:
+        async with semaphore:
             try:
-                result = await ai.classify_email(msg)
-                console.print(
-                    f"  → [green]{result.action.value}[/green] "
-                    f"({result.confidence:.0%}) - {result.reasoning}"
-                )
+                return await ai.classify_email(msg)
             except Exception as e:
-                console.print(f"  → [red]Error:[/red] {e}")
-            console.print()
+                return e
 
-    asyncio.run(classify_all())
+    async def classify_all() -> list[EmailClassification | Exception]:
+        return await asyncio.gather(*(classify_one(msg) for msg in messages))
+
+    # One client (and connection pool) serves every request, closed at the end
+    try:
+        results = asyncio.run(classify_all())
+    finally:
+        ai.close()
+
+    # gather() returns one result per message, in order
+    for msg, result in zip(messages, results, strict=True):
+        console.print(f"[cyan]{msg.subject[:60]}[/cyan]")
+        if isinstance(result, Exception):
+            console.print(f"  → [red]Error:[/red] {result}")
+        else:
+            console.print(
+                f"  → [green]{result.action.value}[/green] "
+                f"({result.confidence:.0%}) - {result.reasoning}"
+            )
+        console.print()
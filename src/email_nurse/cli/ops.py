@@ -9,10 +9,8 @@ from typing import Annotated
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
-from email_nurse.cli import get_settings, ops_app
-from email_nurse.storage.database import AutopilotDatabase
+from email_nurse.cli import get_database, get_settings, ops_app
 
 logger = logging.getLogger(__name__)
 console = Console()
@@ -51,7 +49,7 @@ def _get_db(settings=None):
     """Get database instance."""
     if settings is None:
         settings = get_settings()
-    return AutopilotDatabase(settings.database_path)
+    return get_database(settings.database_path)
 
 
 # ─── stuck-check ──────────────────────────────────────────────────────────
@@ -325,6 +323,8 @@ def db_hygiene(
     dry_run: Annotated[bool, typer.Option("--dry-run", "-n", help="Report only, don't delete")] = False,
 ) -> None:
     """Clean up old database records and vacuum."""
+    from rich.table import Table
+
     settings = get_settings()
     db = _get_db(settings)
 
@@ -1,12 +1,16 @@
 """Apple Reminders CLI commands."""
 
+import asyncio
+from operator import attrgetter
 from typing import Annotated
 
 import typer
-from rich.table import Table
 
 from email_nurse.cli import console, reminders_app
 
+_due_date = attrgetter("due_date")
+_PRIORITY_MARKUP = {"high": "[red]high[/red]", "medium": "[yellow]med[/yellow]", "low": "[dim]low[/dim]"}
+
 
 @reminders_app.command("lists")
 def reminders_lists(
@@ -17,6 +21,8 @@ def reminders_lists(
     Note: The --counts option can be very slow if you have lists with
     thousands of items due to Reminders.app performance limitations.
     """
+    from rich.table import Table
+
     from email_nurse.reminders import get_lists
     from email_nurse.reminders.lists import RemindersAppNotRunningError
 
@@ -61,6 +67,8 @@ def reminders_show(
 
     Note: Lists with many items (1000+) may be slow due to Reminders.app performance.
     """
+    from rich.table import Table
+
     from email_nurse.reminders import get_reminders
     from email_nurse.reminders.lists import RemindersAppNotRunningError
 
@@ -94,8 +102,7 @@ def reminders_show(
         status = "[green]✓[/green]" if r.completed else "[ ]"
         due_str = r.due_date.strftime("%Y-%m-%d") if r.due_date else "-"
 
-        priority_styles = {"high": "[red]high[/red]", "medium": "[yellow]med[/yellow]", "low": "[dim]low[/dim]"}
-        priority_str = priority_styles.get(r.priority_label, "-") if r.priority > 0 else "-"
+        priority_str = _PRIORITY_MARKUP.get(r.priority_label, "-") if r.priority > 0 else "-"
 
         has_link = "📧" if r.email_link else ""
 
@@ -113,7 +120,9 @@ def reminders_incomplete(
     Warning: This may be slow if you have lists with many items.
     Consider using 'reminders show <list>' for specific lists.
     """
-    from email_nurse.reminders import get_lists, get_reminders
+    from rich.table import Table
+
+    from email_nurse.reminders import Reminder, ReminderList, get_lists, get_reminders
     from email_nurse.reminders.lists import RemindersAppNotRunningError
 
     try:
@@ -133,35 +142,54 @@ def reminders_incomplete(
         return
 
     # Warn about large lists
-    large_lists = [lst for lst in lists_with_items if lst.count > 100]
-    if large_lists:
+    if any(lst.count > 100 for lst in lists_with_items):
         console.print(f"[yellow]Warning: Some lists have many items. This may take a while...[/yellow]")
 
-    all_reminders = []
-    remaining = limit
-
-    for lst in lists_with_items:
-        if remaining <= 0:
-            break
-
+    # Each list is a separate Reminders.app round-trip; run a few at a time
+    semaphore = asyncio.Semaphore(4)
+
+    async def fetch_list(lst: ReminderList) -> tuple[ReminderList, list[Reminder] | Exception]:
+        async with semaphore:
+            try:
+                reminders = await asyncio.to_thread(
+                    get_reminders,
+                    list_name=lst.name,
+                    completed=False,
+                    limit=min(limit, lst.count),
+                )
+            except Exception as e:
+                return lst, e
+            return lst, reminders
+
+    async def fetch_all() -> list[Reminder]:
+        collected: list[Reminder] = []
+        tasks = [asyncio.create_task(fetch_list(lst)) for lst in lists_with_items]
         try:
-            reminders = get_reminders(
-                list_name=lst.name,
-                completed=False,
-                limit=min(remaining, lst.count),
-            )
-            all_reminders.extend(reminders)
-            remaining -= len(reminders)
-        except Exception as e:
-            console.print(f"[yellow]Warning: Could not fetch from '{lst.name}': {e}[/yellow]")
-            continue
+            for next_done in asyncio.as_completed(tasks):
+                lst, result = await next_done
+                if isinstance(result, Exception):
+                    console.print(f"[yellow]Warning: Could not fetch from '{lst.name}': {result}[/yellow]")
+                    continue
+                collected.extend(result[: limit - len(collected)])
+                if len(collected) >= limit:
+                    break
+        finally:
+            # Lists still waiting for a slot are not fetched once the limit is hit
+            for task in tasks:
+                task.cancel()
+        return collected
+
+    all_reminders = asyncio.run(fetch_all())
 
     if not all_reminders:
         console.print("[yellow]No incomplete reminders found[/yellow]")
         return
 
-    # Sort by due date (None values at end)
-    all_reminders.sort(key=lambda r: (r.due_date is None, r.due_date or ""))
+    # Sort by due date (None values at end); undated reminders are split off
+    # so the sort key is a plain attribute lookup
+    dated = [r for r in all_reminders if r.due_date is not None]
+    dated.sort(key=_due_date)
+    all_reminders = dated + [r for r in all_reminders if r.due_date is None]
 
     table = Table(title="Incomplete Reminders")
     table.add_column("List", style="dim", width=15)
@@ -171,8 +199,7 @@ def reminders_incomplete(
 
     for r in all_reminders:
         due_str = r.due_date.strftime("%Y-%m-%d") if r.due_date else "-"
-        priority_styles = {"high": "[red]high[/red]", "medium": "[yellow]med[/yellow]", "low": "[dim]low[/dim]"}
-        priority_str = priority_styles.get(r.priority_label, "-") if r.priority > 0 else "-"
+        priority_str = _PRIORITY_MARKUP.get(r.priority_label, "-") if r.priority > 0 else "-"
 
         table.add_row(r.list_name[:15], r.name[:45], due_str, priority_str)
 
@@ -189,6 +216,7 @@ def reminders_create(
 ) -> None:
     """Create a new reminder.
 
+    \b
     Examples:
         email-nurse reminders create "Call Bob"
         email-nurse reminders create "Review report" --list Work --due 2025-01-15
@@ -238,6 +266,7 @@ def reminders_complete(
 
     The reminder ID can be found using 'reminders show <list> --verbose'.
 
+    \b
     Example:
         email-nurse reminders complete "x-apple-reminder://ABC123" --list Work
     """
@@ -265,6 +294,7 @@ def reminders_delete(
 
     The reminder ID can be found using 'reminders show <list> --verbose'.
 
+    \b
     Example:
         email-nurse reminders delete "x-apple-reminder://ABC123" --list Work
     """
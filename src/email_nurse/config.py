@@ -1,9 +1,9 @@
 """Application configuration management."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
-import yaml
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -32,6 +32,10 @@ class Settings(BaseSettings):
     claude_model: str = Field(
         default="claude-haiku-4-5-20251001", description="Claude model to use"
     )
+    anthropic_prompt_cache_enabled: bool = Field(
+        default=True,
+        description="Mark the quick-rule parsing system prompt for Anthropic prompt caching",
+    )
 
     # OpenAI settings
     openai_api_key: str | None = Field(default=None, description="OpenAI API key")
@@ -61,7 +65,7 @@ class Settings(BaseSettings):
 
     # Paths
     config_dir: Path = Field(
-        default=Path.home() / ".config" / "email-nurse",
+        default_factory=lambda: Path.home() / ".config" / "email-nurse",
         description="Configuration directory",
     )
     templates_file: str = Field(
@@ -72,7 +76,7 @@ class Settings(BaseSettings):
     log_level: str = Field(default="INFO", description="Logging level")
     log_file: Path | None = Field(default=None, description="Log file path (deprecated)")
     log_dir: Path = Field(
-        default=Path.home() / "Library" / "Logs",
+        default_factory=lambda: Path.home() / "Library" / "Logs",
         description="Directory for log files (per-account logs written here)",
     )
     log_rotation_size_mb: int = Field(
@@ -81,6 +85,10 @@ class Settings(BaseSettings):
     log_backup_count: int = Field(
         default=3, ge=0, description="Number of rotated log files to keep"
     )
+    log_combined: bool = Field(
+        default=False,
+        description="Write all account activity to one email-nurse.jsonl instead of per-account logs",
+    )
 
     # Autopilot settings
     autopilot_enabled: bool = Field(
@@ -118,6 +126,10 @@ class Settings(BaseSettings):
     mailbox_cache_ttl_minutes: int = Field(
         default=60, ge=1, description="Minutes to cache mailbox list before refreshing"
     )
+    applescript_persistent: bool = Field(
+        default=False,
+        description="Run AppleScript through one long-lived osascript process instead of one per call",
+    )
 
     # Message retrieval provider settings
     message_provider: Literal["applescript", "sysm", "hybrid"] = Field(
@@ -229,3 +241,11 @@ class Settings(BaseSettings):
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load application settings once per process.
+
+    Call ``get_settings.cache_clear()`` to re-read the environment and
+    ``.env`` files, e.g. in tests.
+    """
+    return Settings()
@@ -3,6 +3,12 @@
 This module provides per-account logging to ~/Library/Logs/ with automatic rotation:
 - email-nurse-error.log: Errors from all accounts (ERROR+ level only)
 - email-nurse-{account}.log: Per-account activity logs
+- email-nurse.jsonl: All account activity as JSON lines, replacing the
+  per-account logs when setup_logging(combined=True) is used
+
+Loggers only enqueue records; a single background listener thread owns the
+rotating file handlers, so callers never block on log file I/O. Account log
+records are buffered and written in batches whenever the queue runs dry.
 
 Usage:
     from email_nurse.logging import setup_logging, get_account_logger, get_error_logger
@@ -16,13 +22,28 @@ Usage:
 
     # Errors also go to error log automatically
     logger.error("Something failed")  # Goes to both account log AND error log
+
+    # On per-message paths, pass arguments instead of an f-string so the
+    # message is only built for records that are actually logged
+    logger.info("Moved %s to %s", message_id, folder)
+
+    # Guard work that is only needed for the log line itself
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Headers: %s", dump_headers(message))
 """
 
 from __future__ import annotations
 
+import atexit
+import io
+import json
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import time
+from collections.abc import Mapping
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Any, Literal, cast
 
 # Default log directory (macOS standard location)
 DEFAULT_LOG_DIR = Path.home() / "Library" / "Logs"
@@ -31,36 +52,239 @@ DEFAULT_LOG_DIR = Path.home() / "Library" / "Logs"
 DEFAULT_MAX_BYTES = 5 * 1024 * 1024  # 5MB
 DEFAULT_BACKUP_COUNT = 3
 
+# Account log records held in memory before a write (ERROR+ flushes at once)
+BUFFER_CAPACITY = 512
+
 # Module-level state
 _loggers: dict[str, logging.Logger] = {}
 _error_logger: logging.Logger | None = None
+_error_handler: RawAppendHandler | None = None
 _log_dir: Path = DEFAULT_LOG_DIR
 _max_bytes: int = DEFAULT_MAX_BYTES
 _backup_count: int = DEFAULT_BACKUP_COUNT
 _initialized: bool = False
+_combined: bool = False
+_combined_buffer: MemoryHandler | None = None
 
+# Queue plumbing: loggers share one QueueHandler; the listener thread passes
+# each record to the file handlers registered for its logger name
+_log_queue: queue.SimpleQueue[logging.LogRecord] | None = None
+_queue_handler: QueueHandler | None = None
+_listener: QueueListener | None = None
+_routes: dict[str, tuple[logging.Handler, ...]] = {}
+_buffers: list[MemoryHandler] = []
 
-class ErrorPropagatingHandler(logging.Handler):
-    """Handler that propagates ERROR+ messages to the error logger."""
+
+class AccountContextFilter(logging.Filter):
+    """Tag records with their account so the shared error log can show it.
+
+    The tag is only rendered by the error log formatter; the per-account log
+    line is unchanged.
+    """
 
     def __init__(self, account: str) -> None:
-        super().__init__(level=logging.ERROR)
+        super().__init__()
         self.account = account
+        self.account_prefix = f"[{account}] "
 
-    def emit(self, record: logging.LogRecord) -> None:
-        """Forward error records to the error logger with account context."""
-        error_logger = get_error_logger()
-        # Add account prefix to the message
-        prefixed_record = logging.LogRecord(
-            name=record.name,
-            level=record.levelno,
-            pathname=record.pathname,
-            lineno=record.lineno,
-            msg=f"[{self.account}] {record.getMessage()}",
-            args=(),  # Already formatted via getMessage()
-            exc_info=record.exc_info,
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.account = self.account
+        record.account_prefix = self.account_prefix
+        return True
+
+
+class _SafeNameTable(dict[int, int]):
+    """str.translate table mapping non-alphanumeric characters to a hyphen.
+
+    Entries are computed on first use, so any Unicode character is handled.
+    """
+
+    def __missing__(self, codepoint: int) -> int:
+        mapped = codepoint if chr(codepoint).isalnum() else ord("-")
+        self[codepoint] = mapped
+        return mapped
+
+
+_SAFE_NAME_TABLE = _SafeNameTable()
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders the timestamp's date and time once per second.
+
+    Records logged within the same second reuse the strftime() result; only
+    the milliseconds are filled in per record.
+    """
+
+    def __init__(
+        self,
+        fmt: str | None = None,
+        datefmt: str | None = None,
+        style: Literal["%", "{", "$"] = "%",
+        validate: bool = True,
+        *,
+        defaults: Mapping[str, Any] | None = None,
+    ) -> None:
+        super().__init__(fmt, datefmt, style, validate, defaults=defaults)
+        self._cached_time: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        if datefmt or self.default_msec_format is None:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, prefix = self._cached_time
+        if second != cached_second:
+            prefix = time.strftime(self.default_time_format, self.converter(second))
+            self._cached_time = (second, prefix)
+        return self.default_msec_format % (prefix, record.msecs)
+
+
+class JsonLinesFormatter(CachedTimeFormatter):
+    """Render records as one JSON object per line, tagged with the account."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        if record.exc_info:
+            message = f"{message}\n{self.formatException(record.exc_info)}"
+        return json.dumps(
+            {
+                "ts": self.formatTime(record),
+                "level": record.levelname,
+                "account": getattr(record, "account", None),
+                "msg": message,
+            },
+            ensure_ascii=False,
         )
-        error_logger.handle(prefixed_record)
+
+
+# Formatters are only used from the listener thread, so one instance of each
+# serves every handler. Records from account loggers carry an "[account] "
+# prefix that only the error log shows.
+_ACCOUNT_FORMATTER = CachedTimeFormatter("%(asctime)s [%(levelname)s] %(message)s")
+_ERROR_FORMATTER = CachedTimeFormatter(
+    "%(asctime)s [%(levelname)s] %(account_prefix)s%(message)s",
+    defaults={"account_prefix": ""},
+)
+_JSONL_FORMATTER = JsonLinesFormatter()
+
+
+class RawAppendHandler(RotatingFileHandler):
+    """Rotating handler that appends each record with a single write() call.
+
+    The file is opened unbuffered in append mode, which skips the text and
+    buffered I/O layers (and their locks); the file size is tracked in memory
+    so the rollover check needs no system call.
+    """
+
+    _size: int = 0
+
+    def _open(self) -> io.TextIOWrapper:
+        # The base class types its stream as text; here it is the raw file,
+        # which emit() writes encoded bytes to. Closed by close()/doRollover().
+        raw = Path(self.baseFilename).open("ab", buffering=0)  # noqa: SIM115
+        self._size = raw.tell()
+        return cast(io.TextIOWrapper, raw)
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        data = f"{self.format(record)}\n".encode("utf-8", "backslashreplace")
+        return self._should_rollover(len(data))
+
+    def _should_rollover(self, pending: int) -> bool:
+        """True if writing pending more bytes would pass maxBytes.
+
+        An empty file is never rolled over, so a single oversized record is
+        written rather than rotating an empty log.
+        """
+        if self.maxBytes <= 0 or not self._size:
+            return False
+        if self._size + pending < self.maxBytes:
+            return False
+        # Never roll over anything other than regular files (bpo-45401)
+        path = Path(self.baseFilename)
+        return not (path.exists() and not path.is_file())
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            data = f"{self.format(record)}\n".encode("utf-8", "backslashreplace")
+            if self.stream is None:  # delay was set
+                self.stream = self._open()
+            if self._should_rollover(len(data)):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            cast(io.FileIO, self.stream).write(data)
+            self._size += len(data)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _RouteHandler(logging.Handler):
+    """Listener-side handler that dispatches records by logger name.
+
+    Buffered account logs are flushed once the queue is empty, so a burst of
+    records becomes one write and idle periods still reach the files.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        for handler in _routes.get(record.name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        if _log_queue is not None and _log_queue.empty():
+            _flush_buffers()
+
+
+def _flush_buffers() -> None:
+    for buffered in _buffers:
+        buffered.flush()
+
+
+def _start_listener() -> QueueHandler:
+    """Start the background thread that writes queued records to files.
+
+    Returns:
+        The QueueHandler that loggers attach to feed the listener.
+    """
+    global _log_queue, _queue_handler, _listener
+
+    if _queue_handler is not None:
+        return _queue_handler
+
+    _log_queue = queue.SimpleQueue()
+    _queue_handler = QueueHandler(_log_queue)
+    _listener = QueueListener(_log_queue, _RouteHandler())
+    _listener.start()
+    return _queue_handler
+
+
+def _stop_listener() -> None:
+    """Stop the listener thread after it has written every queued record."""
+    global _log_queue, _queue_handler, _listener
+
+    if _listener is not None:
+        _listener.stop()
+    _flush_buffers()
+    _log_queue = None
+    _queue_handler = None
+    _listener = None
+
+
+# Drain the queue before logging.shutdown() closes the file handlers
+atexit.register(_stop_listener)
+
+
+def _file_handler(path: Path, fmt: logging.Formatter) -> RawAppendHandler:
+    handler = RawAppendHandler(path, maxBytes=_max_bytes, backupCount=_backup_count)
+    handler.setFormatter(fmt)
+    return handler
+
+
+def _buffered(target: logging.Handler) -> MemoryHandler:
+    buffered = MemoryHandler(
+        BUFFER_CAPACITY, flushLevel=logging.ERROR, target=target, flushOnClose=True
+    )
+    _buffers.append(buffered)
+    return buffered
 
 
 def setup_logging(
@@ -68,6 +292,7 @@ def setup_logging(
     log_level: str = "INFO",
     max_bytes: int | None = None,
     backup_count: int | None = None,
+    combined: bool = False,
 ) -> None:
     """Initialize the logging system.
 
@@ -76,12 +301,15 @@ def setup_logging(
         log_level: Minimum log level (default: INFO)
         max_bytes: Max size per log file before rotation (default: 5MB)
         backup_count: Number of backup files to keep (default: 3)
+        combined: Write all accounts to one email-nurse.jsonl file instead
+            of one log file per account (default: False)
     """
-    global _log_dir, _max_bytes, _backup_count, _initialized
+    global _log_dir, _max_bytes, _backup_count, _initialized, _combined
 
     _log_dir = log_dir or DEFAULT_LOG_DIR
     _max_bytes = max_bytes or DEFAULT_MAX_BYTES
     _backup_count = backup_count if backup_count is not None else DEFAULT_BACKUP_COUNT
+    _combined = combined
 
     # Ensure log directory exists
     _log_dir.mkdir(parents=True, exist_ok=True)
@@ -90,6 +318,7 @@ def setup_logging(
     root_logger = logging.getLogger("email_nurse")
     root_logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
 
+    _start_listener()
     _initialized = True
 
 
@@ -99,7 +328,7 @@ def get_error_logger() -> logging.Logger:
     Returns:
         Logger that writes to email-nurse-error.log
     """
-    global _error_logger
+    global _error_logger, _error_handler
 
     if _error_logger is not None:
         return _error_logger
@@ -113,23 +342,25 @@ def get_error_logger() -> logging.Logger:
     logger.propagate = False
 
     # Check if handler already exists (avoid duplicates on re-init)
-    if not logger.handlers:
-        error_file = _log_dir / "email-nurse-error.log"
-        handler = RotatingFileHandler(
-            error_file,
-            maxBytes=_max_bytes,
-            backupCount=_backup_count,
-        )
+    if logger.name not in _routes:
+        handler = _file_handler(_log_dir / "email-nurse-error.log", _ERROR_FORMATTER)
         handler.setLevel(logging.ERROR)
-        handler.setFormatter(
-            logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
-        )
-        logger.addHandler(handler)
+        _error_handler = handler
+        _routes[logger.name] = (handler,)
+        logger.addHandler(_start_listener())
 
     _error_logger = logger
     return logger
 
 
+def _get_error_handler() -> RawAppendHandler:
+    """The shared error log handler, created along with the error logger."""
+    if _error_handler is None:
+        get_error_logger()
+    assert _error_handler is not None  # set by get_error_logger()
+    return _error_handler
+
+
 def get_account_logger(account: str) -> logging.Logger:
     """Get or create a logger for a specific email account.
 
@@ -137,16 +368,20 @@ def get_account_logger(account: str) -> logging.Logger:
         account: Name of the email account (e.g., "iCloud", "Work")
 
     Returns:
-        Logger that writes to email-nurse-{account}.log
+        Logger that writes to email-nurse-{account}.log, or to the shared
+        email-nurse.jsonl in combined mode
     """
-    if account in _loggers:
-        return _loggers[account]
+    global _combined_buffer
+
+    logger = _loggers.get(account)
+    if logger is not None:
+        return logger
 
     if not _initialized:
         setup_logging()
 
     # Sanitize account name for filename (replace non-alphanumeric with hyphen)
-    safe_name = "".join(c if c.isalnum() else "-" for c in account)
+    safe_name = account.translate(_SAFE_NAME_TABLE)
 
     logger = logging.getLogger(f"email_nurse.account.{safe_name}")
     logger.setLevel(logging.INFO)
@@ -154,42 +389,63 @@ def get_account_logger(account: str) -> logging.Logger:
     logger.propagate = False
 
     # Check if handlers already exist (avoid duplicates)
-    if not logger.handlers:
-        # Per-account file handler
-        account_file = _log_dir / f"email-nurse-{safe_name}.log"
-        file_handler = RotatingFileHandler(
-            account_file,
-            maxBytes=_max_bytes,
-            backupCount=_backup_count,
-        )
-        file_handler.setFormatter(
-            logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
-        )
-        logger.addHandler(file_handler)
-
-        # Error propagation handler - sends ERROR+ to error log
-        error_handler = ErrorPropagatingHandler(account)
-        logger.addHandler(error_handler)
+    if logger.name not in _routes:
+        # Per-account file, plus ERROR+ to the shared error log; the filter
+        # supplies the account prefix that log shows
+        error_handler = _get_error_handler()
+        if _combined:
+            # One file, buffer and rollover check shared by every account
+            if _combined_buffer is None:
+                _combined_buffer = _buffered(
+                    _file_handler(_log_dir / "email-nurse.jsonl", _JSONL_FORMATTER)
+                )
+            buffered = _combined_buffer
+        else:
+            buffered = _buffered(
+                _file_handler(_log_dir / f"email-nurse-{safe_name}.log", _ACCOUNT_FORMATTER)
+            )
+        _routes[logger.name] = (buffered, error_handler)
+        logger.addFilter(AccountContextFilter(account))
+        logger.addHandler(_start_listener())
 
     _loggers[account] = logger
     return logger
 
 
 def reset_logging() -> None:
-    """Reset logging state (primarily for testing)."""
-    global _loggers, _error_logger, _initialized
+    """Reset logging state (primarily for testing).
 
-    # Close all handlers
-    for logger in _loggers.values():
-        for handler in logger.handlers[:]:
-            handler.close()
-            logger.removeHandler(handler)
+    Queued records are written out before the file handlers are closed.
+    """
+    global _loggers, _error_logger, _error_handler, _initialized, _combined_buffer
+
+    _stop_listener()
 
-    if _error_logger:
-        for handler in _error_logger.handlers[:]:
-            handler.close()
-            _error_logger.removeHandler(handler)
+    for logger in [*_loggers.values(), _error_logger]:
+        if logger is None:
+            continue
+        for handler in logger.handlers[:]:
+            if isinstance(handler, QueueHandler):
+                logger.removeHandler(handler)
+        for log_filter in logger.filters[:]:
+            logger.removeFilter(log_filter)
+
+    # Close each buffer before its target: closing flushes anything still
+    # buffered, and a closed target would reopen its file to write it
+    for buffered in _buffers:
+        target = buffered.target
+        buffered.close()
+        if target is not None:
+            target.close()
+    _buffers.clear()
+    _combined_buffer = None
+
+    # The shared error handler appears in several routes; close it once
+    for handler in {h for handlers in _routes.values() for h in handlers}:
+        handler.close()
+    _routes.clear()
 
     _loggers = {}
     _error_logger = None
+    _error_handler = None
     _initialized = False
@@ -1,6 +1,6 @@
 """Mail.app interface layer via AppleScript."""
 
-from email_nurse.mail.accounts import get_accounts, sync_account
+from email_nurse.mail.accounts import get_accounts, sync_account, sync_accounts
 from email_nurse.mail.actions import (
     delete_message,
     forward_message,
@@ -16,6 +16,7 @@ __all__ = [
     "run_applescript",
     "get_accounts",
     "sync_account",
+    "sync_accounts",
     "get_messages",
     "move_message",
     "delete_message",
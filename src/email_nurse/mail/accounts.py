@@ -1,16 +1,17 @@
 """Mail.app account detection and management.
 
 Uses sysm CLI for account listing. AppleScript is only used for
-sync_account() and sync_all_accounts() (sysm gaps).
+sync_account(), sync_accounts() and sync_all_accounts() (sysm gaps).
 """
 
+import time
 from dataclasses import dataclass
 
 from email_nurse.mail.applescript import escape_applescript_string, run_applescript
 from email_nurse.mail.sysm import get_accounts_sysm
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MailAccount:
     """Represents a Mail.app email account."""
 
@@ -21,13 +22,33 @@ class MailAccount:
     account_type: str
 
 
+# Account configuration rarely changes; reuse a recent listing
+ACCOUNTS_CACHE_TTL_SECONDS = 60.0
+_accounts_cache: tuple[float, list[MailAccount]] | None = None
+
+
+def invalidate_accounts_cache() -> None:
+    """Forget the cached account list so the next lookup asks Mail.app."""
+    global _accounts_cache
+    _accounts_cache = None
+
+
 def get_accounts() -> list[MailAccount]:
     """
     Retrieve all configured email accounts from Mail.app via sysm.
 
+    Results are cached for ACCOUNTS_CACHE_TTL_SECONDS; use
+    invalidate_accounts_cache() after changing accounts in Mail.app.
+
     Returns:
         List of MailAccount objects representing each account.
     """
+    global _accounts_cache
+
+    now = time.monotonic()
+    if _accounts_cache is not None and now - _accounts_cache[0] < ACCOUNTS_CACHE_TTL_SECONDS:
+        return list(_accounts_cache[1])
+
     data = get_accounts_sysm()
 
     accounts = []
@@ -39,7 +60,7 @@ def get_accounts() -> list[MailAccount]:
         # email addresses may be a list or comma-separated string
         emails_raw = acct.get("emailAddresses", acct.get("email", []))
         if isinstance(emails_raw, str):
-            email_addresses = [e.strip() for e in emails_raw.split(",") if e.strip()]
+            email_addresses = [e for e in map(str.strip, emails_raw.split(",")) if e]
         elif isinstance(emails_raw, list):
             email_addresses = emails_raw
         else:
@@ -58,7 +79,8 @@ def get_accounts() -> list[MailAccount]:
             )
         )
 
-    return accounts
+    _accounts_cache = (now, accounts)
+    return list(accounts)
 
 
 # --- AppleScript-only operations (sysm gaps) ---
@@ -87,6 +109,35 @@ def sync_account(account_name: str) -> bool:
     return True
 
 
+def sync_accounts(account_names: list[str]) -> bool:
+    """
+    Trigger a sync/check for new mail on several accounts at once.
+
+    Uses a single AppleScript run, instead of one osascript process per
+    account as repeated sync_account() calls would.
+
+    Args:
+        account_names: Names of the accounts to sync.
+
+    Returns:
+        True if sync was triggered successfully.
+    """
+    if not account_names:
+        return True
+
+    names_literal = ", ".join(f'"{escape_applescript_string(name)}"' for name in account_names)
+    script = f'''
+    tell application "Mail"
+        repeat with acctName in {{{names_literal}}}
+            check for new mail for account (contents of acctName)
+        end repeat
+    end tell
+    '''
+
+    run_applescript(script)
+    return True
+
+
 def sync_all_accounts() -> bool:
     """
     Trigger a sync/check for new mail on all accounts.
@@ -5,8 +5,20 @@ create_mailbox(), create_local_mailbox(), and get_local_mailboxes() (sysm gaps).
 """
 
 import logging
+import smtplib
+import time
 from dataclasses import dataclass
 from difflib import SequenceMatcher
+from email.message import EmailMessage
+from functools import lru_cache
+
+# rapidfuzz (the "fast" extra) scores mailbox names in native code and skips
+# candidates that cannot reach the cutoff; difflib is the fallback
+try:
+    from rapidfuzz import fuzz as _fuzz
+    from rapidfuzz import process as _fuzz_process
+except ImportError:  # pragma: no cover - optional dependency
+    _fuzz = _fuzz_process = None  # type: ignore[assignment]
 
 from email_nurse.mail.applescript import escape_applescript_string, run_applescript
 from email_nurse.mail.sysm import (
@@ -54,29 +66,86 @@ def get_all_mailboxes(account: str) -> list[str]:
     return [mbox.get("name", "") for mbox in mailboxes if mbox.get("name")]
 
 
-def find_similar_mailbox(target: str, existing: list[str], threshold: float = 0.6) -> str | None:
+@lru_cache(maxsize=32)
+def _lowered_mailboxes(mailboxes: tuple[str, ...]) -> tuple[tuple[str, ...], dict[str, str]]:
+    """Lowercased mailbox names and a lowercase -> name map, memoized per set.
+
+    The map keeps the first mailbox for each lowercased name.
+    """
+    lowered = tuple(mailbox.lower() for mailbox in mailboxes)
+    by_lower: dict[str, str] = {}
+    for mailbox, mailbox_lower in zip(mailboxes, lowered, strict=True):
+        by_lower.setdefault(mailbox_lower, mailbox)
+    return lowered, by_lower
+
+
+def mailbox_exists(target: str, existing: list[str] | tuple[str, ...]) -> bool:
+    """
+    Check whether a mailbox name is present, ignoring case.
+
+    Uses the same memoized lowercase map as find_similar_mailbox(), so
+    repeated checks against one account's mailboxes are a hashed lookup.
+
+    Args:
+        target: The mailbox name to look for.
+        existing: List or tuple of existing mailbox names.
+
+    Returns:
+        True if a mailbox with that name (in any case) exists.
+    """
+    return target.lower() in _lowered_mailboxes(tuple(existing))[1]
+
+
+def find_similar_mailbox(
+    target: str, existing: list[str] | tuple[str, ...], threshold: float = 0.6
+) -> str | None:
     """
     Find a similar mailbox name using fuzzy matching.
 
+    Lowercasing of ``existing`` is cached, so repeated lookups against the
+    same account's mailboxes only pay for it once.
+
     Args:
         target: The target mailbox name to match.
-        existing: List of existing mailbox names.
+        existing: List or tuple of existing mailbox names.
         threshold: Minimum similarity ratio (0.0 to 1.0) to consider a match.
 
     Returns:
         The most similar existing mailbox name, or None if no good match.
     """
     target_lower = target.lower()
+    existing_lower, by_lower = _lowered_mailboxes(tuple(existing))
+
+    # Check for exact match first (case-insensitive), with one hashed lookup
+    exact = by_lower.get(target_lower)
+    if exact is not None:
+        return exact
+
+    if _fuzz_process is not None:
+        match = _fuzz_process.extractOne(
+            target_lower, existing_lower, scorer=_fuzz.ratio, score_cutoff=threshold * 100
+        )
+        return existing[match[2]] if match else None
+
     best_match = None
     best_ratio = 0.0
-
-    for mailbox in existing:
-        # Check for exact match first (case-insensitive)
-        if mailbox.lower() == target_lower:
-            return mailbox
+    matcher = SequenceMatcher(None, target_lower)
+    target_len = len(target_lower)
+
+    for mailbox, mailbox_lower in zip(existing, existing_lower, strict=True):
+        # Skip candidates whose cheap upper bounds cannot beat the current
+        # best: the length bound first, then difflib's quick_ratio()
+        mailbox_len = len(mailbox_lower)
+        bound = 2 * min(target_len, mailbox_len) / (target_len + mailbox_len)
+        if bound < threshold or bound <= best_ratio:
+            continue
+        matcher.set_seq2(mailbox_lower)
+        bound = matcher.quick_ratio()
+        if bound < threshold or bound <= best_ratio:
+            continue
 
         # Calculate similarity ratio
-        ratio = SequenceMatcher(None, target_lower, mailbox.lower()).ratio()
+        ratio = matcher.ratio()
         if ratio > best_ratio and ratio >= threshold:
             best_ratio = ratio
             best_match = mailbox
@@ -121,18 +190,21 @@ def get_local_mailboxes() -> list[str]:
     Returns:
         List of local mailbox names.
     """
+    # Fetch every name and account in two bulk requests (not two Apple
+    # events per mailbox), filter locally, and join once
     script = '''
     tell application "Mail"
-        set output to ""
-        set RS to (ASCII character 30)  -- Record Separator
-        repeat with mbox in mailboxes
-            if account of mbox is missing value then
-                if output is not "" then set output to output & RS
-                set output to output & name of mbox
-            end if
-        end repeat
-        return output
+        set mboxNames to name of every mailbox
+        set mboxAccounts to account of every mailbox
     end tell
+    set localNames to {}
+    repeat with i from 1 to count of mboxNames
+        if item i of mboxAccounts is missing value then
+            copy item i of mboxNames to end of localNames
+        end if
+    end repeat
+    set AppleScript's text item delimiters to (ASCII character 30)  -- Record Separator
+    return localNames as text
     '''
     result = run_applescript(script)
     # Handle empty string case - don't return [''] for empty results
@@ -200,7 +272,7 @@ def move_message(
     return move_message_sysm(message_id, target_mailbox, account)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PendingMove:
     """Represents a pending move operation for batch processing."""
 
@@ -412,6 +484,148 @@ def compose_email(
     )
 
 
+class SmtpSender:
+    """
+    Authenticated SMTP session that can be reused for several messages.
+
+    The TLS handshake and login happen once when the context is entered;
+    each send() reuses the session. A session idle for longer than
+    KEEPALIVE_SECONDS is checked with NOOP first, and a dropped connection
+    is re-established on the next send.
+
+    Example:
+        with SmtpSender(host, 587, user, password) as sender:
+            for msg in messages:
+                sender.send(msg)
+    """
+
+    KEEPALIVE_SECONDS = 60.0
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        *,
+        use_tls: bool = True,
+        timeout: float = 30,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self._server: smtplib.SMTP | None = None
+        self._last_used = 0.0
+
+    def __enter__(self) -> "SmtpSender":
+        self._connect()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open the connection, authenticate, and return the session."""
+        if self.use_tls:
+            # Use STARTTLS (port 587)
+            server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        else:
+            # Use SSL (port 465)
+            server = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout)
+
+        try:
+            server.ehlo()
+            if self.use_tls:
+                server.starttls()
+                server.ehlo()
+            server.login(self.username, self.password)
+        except BaseException:
+            # Don't leak the socket when any step of the handshake fails
+            server.close()
+            raise
+        self._server = server
+        self._last_used = time.monotonic()
+        return server
+
+    def _ensure_connected(self) -> smtplib.SMTP:
+        """Return a live session, reconnecting if it was dropped."""
+        server = self._server
+        if server is not None and time.monotonic() - self._last_used > self.KEEPALIVE_SECONDS:
+            try:
+                server.noop()
+            except smtplib.SMTPServerDisconnected:
+                server = self._server = None
+        if server is None:
+            server = self._connect()
+        return server
+
+    def send(self, msg: EmailMessage) -> None:
+        """Send one message over the shared session."""
+        server = self._ensure_connected()
+        try:
+            server.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            # Server closed the session between sends; retry once on a new one
+            self._server = None
+            self._ensure_connected().send_message(msg)
+        self._last_used = time.monotonic()
+
+    def close(self) -> None:
+        """Quit the session if one is open."""
+        server, self._server = self._server, None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except smtplib.SMTPServerDisconnected:
+            server.close()
+
+
+def _is_7bit_text(content: str, max_line_length: int | None) -> bool:
+    """True if set_content() would send content as-is with 7bit encoding.
+
+    Mirrors its heuristic: ASCII only, and no line longer than the policy's
+    max_line_length (longer lines get quoted-printable). Policies without a
+    line limit are left to set_content().
+    """
+    if max_line_length is None or not content.isascii():
+        return False
+    return max(map(len, content.encode("ascii").splitlines()), default=0) <= max_line_length
+
+
+def _build_message(
+    sender: str,
+    to_address: str,
+    subject: str,
+    content: str,
+    html_content: str | None = None,
+) -> EmailMessage:
+    """Build a plain text email, with an optional HTML alternative."""
+    msg = EmailMessage()
+    msg["From"] = sender
+    msg["To"] = to_address
+    msg["Subject"] = subject
+
+    if html_content is None and _is_7bit_text(content, msg.policy.max_line_length):
+        # Plain ASCII needs no charset or transfer encoding work, so skip
+        # set_content() and set the headers it would produce directly
+        msg["Content-Type"] = 'text/plain; charset="utf-8"'
+        msg["Content-Transfer-Encoding"] = "7bit"
+        msg["MIME-Version"] = "1.0"
+        msg.set_payload(content if content.endswith("\n") else content + "\n")
+        return msg
+
+    msg.set_content(content)
+
+    # Add HTML alternative if provided
+    if html_content:
+        msg.add_alternative(html_content, subtype="html")
+    return msg
+
+
 def send_email_smtp(
     to_address: str,
     subject: str,
@@ -428,6 +642,9 @@ def send_email_smtp(
     """
     Send email using direct SMTP connection (bypasses Mail.app).
 
+    For several messages, use SmtpSender directly so the connection and
+    login are shared.
+
     Args:
         to_address: Recipient email address.
         subject: Email subject line.
@@ -446,42 +663,13 @@ def send_email_smtp(
     Raises:
         Various SMTP exceptions if sending fails.
     """
-    import smtplib
-    from email.message import EmailMessage
-
     # Default from_address to smtp_username
     sender = from_address or smtp_username
-
-    # Create email message
-    msg = EmailMessage()
-    msg["From"] = sender
-    msg["To"] = to_address
-    msg["Subject"] = subject
-    msg.set_content(content)
-
-    # Add HTML alternative if provided
-    if html_content:
-        msg.add_alternative(html_content, subtype="html")
+    msg = _build_message(sender, to_address, subject, content, html_content)
 
     try:
-        # Connect to SMTP server
-        if use_tls:
-            # Use STARTTLS (port 587)
-            server = smtplib.SMTP(smtp_host, smtp_port, timeout=30)
-            server.ehlo()
-            server.starttls()
-            server.ehlo()
-        else:
-            # Use SSL (port 465)
-            server = smtplib.SMTP_SSL(smtp_host, smtp_port, timeout=30)
-            server.ehlo()
-
-        # Authenticate
-        server.login(smtp_username, smtp_password)
-
-        # Send email
-        server.send_message(msg)
-        server.quit()
+        with SmtpSender(smtp_host, smtp_port, smtp_username, smtp_password, use_tls=use_tls) as smtp:
+            smtp.send(msg)
         return True
 
     except smtplib.SMTPAuthenticationError as e:
@@ -10,7 +10,7 @@ import time
 from dataclasses import dataclass
 from datetime import datetime
 
-from email_nurse.config import Settings
+from email_nurse.config import get_settings
 from email_nurse.mail.applescript import escape_applescript_string, run_applescript
 from email_nurse.mail.sysm import (
     get_inbox_count_sysm,
@@ -72,7 +72,7 @@ def get_messages(
     Returns:
         List of EmailMessage objects.
     """
-    settings = Settings()
+    settings = get_settings()
     provider = settings.message_provider
     if provider not in ("sysm", "hybrid"):
         logger.info("message_provider=%s is deprecated, using sysm", provider)
@@ -102,7 +102,7 @@ def get_messages_metadata(
         List of EmailMessage objects with content_loaded=False.
         Call load_message_content() to fetch content when needed.
     """
-    settings = Settings()
+    settings = get_settings()
     provider = settings.message_provider
     if provider not in ("sysm", "hybrid"):
         logger.info("message_provider=%s is deprecated, using sysm", provider)
@@ -171,9 +171,13 @@ def load_message_headers(email: EmailMessage) -> str:
     mailbox_escaped = escape_applescript_string(email.mailbox)
     account_escaped = escape_applescript_string(email.account)
 
-    script = f'''
+    try:
+        # Mail.app message IDs are integers; a non-numeric ID is rejected here
+        # rather than spliced into the script, and Mail compares numbers natively
+        message_id = int(email.id)
+        script = f'''
     tell application "Mail"
-        set msg to first message of mailbox "{mailbox_escaped}" of account "{account_escaped}" whose id is {email.id}
+        set msg to first message of mailbox "{mailbox_escaped}" of account "{account_escaped}" whose id is {message_id}
         set msgHeaders to ""
         try
             set msgHeaders to all headers of msg
@@ -181,8 +185,6 @@ def load_message_headers(email: EmailMessage) -> str:
         return msgHeaders
     end tell
     '''
-
-    try:
         headers = run_applescript(script, timeout=30) or ""
     except Exception:
         headers = ""
@@ -192,12 +194,14 @@ def load_message_headers(email: EmailMessage) -> str:
     return headers
 
 
-def get_message_by_id(message_id: str) -> EmailMessage | None:
+def get_message_by_id(message_id: str, content_limit: int | None = None) -> EmailMessage | None:
     """
     Retrieve a specific message by its ID.
 
     Args:
         message_id: The Mail.app message ID.
+        content_limit: Maximum characters of body content to keep, or None
+            for the full body.
 
     Returns:
         EmailMessage if found, None otherwise.
@@ -207,10 +211,13 @@ def get_message_by_id(message_id: str) -> EmailMessage | None:
     try:
         data = run_sysm_json(["mail", "read", str(message_id), "--json"])
         if isinstance(data, list):
-            data = data[0] if data else None
+            data = data[0] if data else {}
         if not data:
             return None
 
+        if content_limit is not None and data.get("content"):
+            data["content"] = data["content"][:content_limit]
+
         from email_nurse.mail.sysm import parse_sysm_message
         return parse_sysm_message(data, content_loaded=True)
     except SysmError:
@@ -12,7 +12,8 @@ import json
 import logging
 import shutil
 import subprocess
-from datetime import datetime
+from datetime import datetime, timedelta
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -37,22 +38,33 @@ class SysmTimeoutError(SysmError):
     """Raised when sysm times out."""
 
 
+# Resolved sysm path, reused by every command once found
+_sysm_path: str | None = None
+
+
 def _find_sysm() -> str | None:
     """Locate the sysm binary.
 
     Checks PATH first, then common user-local locations that may not
-    be in launchd's restricted PATH.
+    be in launchd's restricted PATH. A successful lookup is remembered,
+    so batched commands do not rescan PATH for each message; a failed
+    one is retried on the next call.
 
     Returns:
         Full path to sysm binary, or None if not found
     """
+    global _sysm_path
+
+    if _sysm_path is not None:
+        return _sysm_path
+
     # Check PATH first
     path = shutil.which("sysm")
     if path:
+        _sysm_path = path
         return path
 
     # Check common locations not in launchd's default PATH
-    from pathlib import Path
     candidates = [
         Path.home() / "bin" / "sysm",
         Path.home() / ".local" / "bin" / "sysm",
@@ -60,7 +72,8 @@ def _find_sysm() -> str | None:
     ]
     for candidate in candidates:
         if candidate.exists() and candidate.is_file():
-            return str(candidate)
+            _sysm_path = str(candidate)
+            return _sysm_path
 
     return None
 
@@ -85,16 +98,19 @@ def run_sysm(args: list[str], timeout: int = 30) -> str:
         Command stdout as string
 
     Raises:
-        SysmNotFoundError: If sysm binary not found
+        SysmNotFoundError: If sysm binary not found (or has moved)
         SysmTimeoutError: If command times out
         SysmError: If command fails
     """
+    global _sysm_path
+
     sysm_path = _find_sysm()
     if not sysm_path:
         raise SysmNotFoundError("sysm binary not found on PATH or in ~/bin, ~/.local/bin, /opt/homebrew/bin")
 
     full_cmd = [sysm_path] + args
-    logger.debug(f"Running sysm command: {' '.join(full_cmd)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Running sysm command: %s", " ".join(full_cmd))
 
     try:
         result = subprocess.run(
@@ -112,6 +128,11 @@ def run_sysm(args: list[str], timeout: int = 30) -> str:
             f"sysm command failed with exit code {e.returncode}: {e.stderr}",
             full_cmd
         ) from e
+    except FileNotFoundError as e:
+        # The binary moved (e.g. reinstalled) since it was found; forget the
+        # cached path so the next call looks it up again
+        _sysm_path = None
+        raise SysmNotFoundError(f"sysm binary no longer at {sysm_path}", full_cmd) from e
     except Exception as e:
         raise SysmError(f"sysm command failed: {e}", full_cmd) from e
 
@@ -272,7 +293,6 @@ def get_messages_metadata_sysm(
             logger.info(
                 "Inbox listing timed out, falling back to search"
             )
-            from datetime import datetime, timedelta
             after_date = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
             cmd = ["mail", "search", "--after", after_date,
                    "--limit", str(limit), "--json"]
@@ -368,7 +388,7 @@ def load_message_content_sysm(email: "EmailMessage") -> str:
     email.content = content
     email.content_loaded = True
 
-    logger.debug(f"Loaded content for message {email.id} via sysm ({len(content)} chars)")
+    logger.debug("Loaded content for message %s via sysm (%d chars)", email.id, len(content))
     return content
 
 
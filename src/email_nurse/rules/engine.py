@@ -1,5 +1,7 @@
 """Rule engine for processing emails against defined rules."""
 
+from bisect import insort
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field
@@ -79,6 +81,9 @@ class Rule(BaseModel):
             return any(all_results)
 
 
+_rule_priority = attrgetter("priority")
+
+
 class RuleEngine:
     """Engine for processing emails against rules."""
 
@@ -94,13 +99,15 @@ class RuleEngine:
             rules: List of rules to process.
             ai_provider: AI provider for AI-based classification.
         """
-        self.rules = sorted(rules or [], key=lambda r: r.priority)
+        self.rules = sorted(rules or [], key=_rule_priority)
         self.ai_provider = ai_provider
 
     def add_rule(self, rule: Rule) -> None:
-        """Add a rule and re-sort by priority."""
-        self.rules.append(rule)
-        self.rules.sort(key=lambda r: r.priority)
+        """Add a rule, keeping the list in priority order.
+
+        Inserts after any rules of equal priority, matching a stable sort.
+        """
+        insort(self.rules, rule, key=_rule_priority)
 
     def remove_rule(self, name: str) -> bool:
         """Remove a rule by name."""
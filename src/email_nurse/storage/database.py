@@ -7,13 +7,20 @@ from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Generator
 
+# orjson (the "fast" extra) decodes JSON columns several times faster; its
+# JSONDecodeError subclasses json.JSONDecodeError, so error handling is shared
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    from json import loads as _json_loads  # type: ignore[assignment]
+
 
 def _safe_json_loads(data: str | None, default: Any = None) -> Any:
     """Safely parse JSON, returning default on error."""
     if not data:
         return default
     try:
-        return json.loads(data)
+        return _json_loads(data)
     except (json.JSONDecodeError, TypeError) as e:
         # Log but don't crash - return default for corrupted data
         import sys
@@ -21,6 +28,22 @@ def _safe_json_loads(data: str | None, default: Any = None) -> Any:
         return default
 
 
+def _folder_action_from_row(row: sqlite3.Row) -> dict[str, Any]:
+    """Convert a pending_actions row with folder columns to a record dict."""
+    return {
+        "id": row["id"],
+        "message_id": row["message_id"],
+        "email_summary": row["email_summary"],
+        "proposed_action": _safe_json_loads(row["proposed_action"], {}),
+        "confidence": row["confidence"],
+        "reasoning": row["reasoning"],
+        "created_at": row["created_at"],
+        "status": row["status"],
+        "pending_folder": row["pending_folder"],
+        "pending_account": row["pending_account"],
+    }
+
+
 class AutopilotDatabase:
     """SQLite database for tracking processed emails and pending actions."""
 
@@ -39,6 +62,8 @@ class AutopilotDatabase:
         """Context manager for database connections."""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        # Safe with WAL (set once in _ensure_schema); skips an fsync per commit
+        conn.execute("PRAGMA synchronous=NORMAL")
         try:
             yield conn
             conn.commit()
@@ -53,6 +78,9 @@ class AutopilotDatabase:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         with self._connection() as conn:
+            # WAL persists in the database file and lets readers (CLI) and
+            # the writer (autopilot/watcher) run without blocking each other
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.executescript("""
                 -- Track which emails have been processed
                 CREATE TABLE IF NOT EXISTS processed_emails (
@@ -301,6 +329,14 @@ class AutopilotDatabase:
         limit: int = 100,
     ) -> list[dict[str, Any]]:
         """Get pending actions by status."""
+        return list(self.iter_pending_actions(status=status, limit=limit))
+
+    def iter_pending_actions(
+        self,
+        status: str = "pending",
+        limit: int = 100,
+    ) -> Generator[dict[str, Any], None, None]:
+        """Yield pending actions by status as the cursor produces them."""
         with self._connection() as conn:
             cursor = conn.execute(
                 """
@@ -313,9 +349,8 @@ class AutopilotDatabase:
                 """,
                 (status, limit),
             )
-            results = []
-            for row in cursor.fetchall():
-                results.append({
+            for row in cursor:
+                yield {
                     "id": row["id"],
                     "message_id": row["message_id"],
                     "email_summary": row["email_summary"],
@@ -324,8 +359,7 @@ class AutopilotDatabase:
                     "reasoning": row["reasoning"],
                     "created_at": row["created_at"],
                     "status": row["status"],
-                })
-            return results
+                }
 
     def get_pending_action(self, action_id: int) -> dict[str, Any] | None:
         """Get a specific pending action by ID."""
@@ -345,7 +379,7 @@ class AutopilotDatabase:
                 "id": row["id"],
                 "message_id": row["message_id"],
                 "email_summary": row["email_summary"],
-                "proposed_action": json.loads(row["proposed_action"]),
+                "proposed_action": _json_loads(row["proposed_action"]),
                 "confidence": row["confidence"],
                 "reasoning": row["reasoning"],
                 "created_at": row["created_at"],
@@ -490,21 +524,43 @@ class AutopilotDatabase:
                 """,
                 (folder, account),
             )
-            results = []
-            for row in cursor.fetchall():
-                results.append({
-                    "id": row["id"],
-                    "message_id": row["message_id"],
-                    "email_summary": row["email_summary"],
-                    "proposed_action": _safe_json_loads(row["proposed_action"], {}),
-                    "confidence": row["confidence"],
-                    "reasoning": row["reasoning"],
-                    "created_at": row["created_at"],
-                    "status": row["status"],
-                    "pending_folder": row["pending_folder"],
-                    "pending_account": row["pending_account"],
-                })
-            return results
+            return [_folder_action_from_row(row) for row in cursor.fetchall()]
+
+    def get_actions_by_folder(
+        self,
+        account: str | None = None,
+    ) -> dict[tuple[str, str], list[dict[str, Any]]]:
+        """Get all pending folder actions in one query, grouped by folder.
+
+        Args:
+            account: Filter by account, or None for all accounts.
+
+        Returns:
+            Dict mapping (folder, account) to its pending action records,
+            oldest first.
+        """
+        query = """
+            SELECT id, message_id, email_summary, proposed_action,
+                   confidence, reasoning, created_at, status,
+                   pending_folder, pending_account
+            FROM pending_actions
+            WHERE status = 'pending'
+              AND pending_folder IS NOT NULL
+        """
+        params: list[Any] = []
+
+        if account:
+            query += " AND pending_account = ?"
+            params.append(account)
+
+        query += " ORDER BY created_at"
+
+        grouped: dict[tuple[str, str], list[dict[str, Any]]] = {}
+        with self._connection() as conn:
+            for row in conn.execute(query, params):
+                key = (row["pending_folder"], row["pending_account"])
+                grouped.setdefault(key, []).append(_folder_action_from_row(row))
+        return grouped
 
     def get_folder_pending_messages(
         self,
@@ -598,6 +654,19 @@ class AutopilotDatabase:
         source_filter: str | None = None,
     ) -> list[dict[str, Any]]:
         """Get audit log entries."""
+        return list(
+            self.iter_audit_log(
+                limit=limit, action_filter=action_filter, source_filter=source_filter
+            )
+        )
+
+    def iter_audit_log(
+        self,
+        limit: int = 100,
+        action_filter: str | None = None,
+        source_filter: str | None = None,
+    ) -> Generator[dict[str, Any], None, None]:
+        """Yield audit log entries, newest first, as the cursor produces them."""
         query = "SELECT * FROM audit_log WHERE 1=1"
         params: list[Any] = []
 
@@ -613,17 +682,15 @@ class AutopilotDatabase:
 
         with self._connection() as conn:
             cursor = conn.execute(query, params)
-            results = []
-            for row in cursor.fetchall():
-                results.append({
+            for row in cursor:
+                yield {
                     "id": row["id"],
                     "message_id": row["message_id"],
                     "action": row["action"],
                     "source": row["source"],
                     "timestamp": row["timestamp"],
                     "details": _safe_json_loads(row["details"]),
-                })
-            return results
+                }
 
     # ─── Statistics ───────────────────────────────────────────────────────
 
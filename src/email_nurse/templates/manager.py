@@ -5,6 +5,8 @@ from pathlib import Path
 import yaml
 from pydantic import BaseModel, Field
 
+from email_nurse.yaml_io import SafeDumper, SafeLoader
+
 
 class Template(BaseModel):
     """A reply template."""
@@ -70,8 +72,8 @@ class TemplateManager:
         if not path.exists():
             return cls()
 
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=SafeLoader) or {}
 
         templates = []
         for name, config in data.get("templates", {}).items():
@@ -101,5 +103,12 @@ class TemplateManager:
                 "variables": template.variables,
             }
 
-        with open(path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        with open(path, "wb") as f:
+            yaml.dump(
+                data,
+                f,
+                Dumper=SafeDumper,
+                encoding="utf-8",
+                default_flow_style=False,
+                sort_keys=False,
+            )
@@ -0,0 +1,8 @@
+"""YAML loader and dumper selection shared by config and template files."""
+
+import yaml
+
+# Prefer the LibYAML-backed loader and dumper; PyYAML builds without them
+# fall back to pure Python
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
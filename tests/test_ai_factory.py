@@ -0,0 +1,73 @@
+"""Tests for AI provider construction from settings."""
+
+import pytest
+
+from email_nurse.ai.claude import ClaudeProvider
+from email_nurse.ai.factory import create_ai_provider, get_model_name
+from email_nurse.ai.ollama import OllamaProvider
+from email_nurse.ai.openai import OpenAIProvider
+from email_nurse.config import Settings
+
+
+@pytest.fixture
+def settings() -> Settings:
+    """Settings with explicit provider configuration."""
+    return Settings(
+        _env_file=None,
+        ai_provider="openai",
+        anthropic_api_key="sk-ant-test",
+        claude_model="claude-test",
+        openai_api_key="sk-test",
+        openai_model="gpt-test",
+        ollama_host="http://ollama:11434",
+        ollama_model="llama-test",
+    )
+
+
+class TestCreateAIProvider:
+    """Tests for create_ai_provider()."""
+
+    def test_claude(self, settings: Settings) -> None:
+        """Claude provider receives the API key and model."""
+        ai = create_ai_provider(settings, "claude")
+        assert isinstance(ai, ClaudeProvider)
+        assert ai.api_key == "sk-ant-test"
+        assert ai.model == "claude-test"
+        assert ai.prompt_cache is True
+
+    def test_claude_prompt_cache_disabled(self, settings: Settings) -> None:
+        """The prompt cache setting is passed through to the Claude provider."""
+        settings.anthropic_prompt_cache_enabled = False
+        ai = create_ai_provider(settings, "claude")
+        assert ai.prompt_cache is False
+
+    def test_ollama(self, settings: Settings) -> None:
+        """Ollama provider receives the host and model."""
+        ai = create_ai_provider(settings, "ollama")
+        assert isinstance(ai, OllamaProvider)
+        assert ai.host == "http://ollama:11434"
+        assert ai.model == "llama-test"
+
+    def test_defaults_to_settings_provider(self, settings: Settings) -> None:
+        """Without an explicit name, settings.ai_provider is used."""
+        ai = create_ai_provider(settings)
+        assert isinstance(ai, OpenAIProvider)
+        assert ai.model == "gpt-test"
+
+    def test_unknown_provider(self, settings: Settings) -> None:
+        """Unknown provider names raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown provider"):
+            create_ai_provider(settings, "bogus")
+
+
+class TestGetModelName:
+    """Tests for get_model_name()."""
+
+    def test_known_provider(self, settings: Settings) -> None:
+        """Model name comes from the provider's model setting."""
+        assert get_model_name(settings, "claude") == "claude-test"
+        assert get_model_name(settings) == "gpt-test"
+
+    def test_unknown_provider(self, settings: Settings) -> None:
+        """Unknown providers report 'unknown'."""
+        assert get_model_name(settings, "bogus") == "unknown"
@@ -23,6 +23,11 @@ class TestEscapeAppleScriptString:
         result = escape_applescript_string('Say "Hello\\World"')
         assert result == 'Say \\"Hello\\\\World\\"'
 
+    def test_control_characters_become_spaces(self) -> None:
+        """Test that newlines, carriage returns, and tabs cannot end the literal."""
+        result = escape_applescript_string('a\nb\r\nc\t"d"')
+        assert result == 'a b  c \\"d\\"'
+
     def test_no_escape_needed(self) -> None:
         """Test string that needs no escaping."""
         result = escape_applescript_string("Simple text")
@@ -32,3 +37,90 @@ class TestEscapeAppleScriptString:
         """Test empty string."""
         result = escape_applescript_string("")
         assert result == ""
+
+
+# Stand-in for the JXA loop: same line protocol, "fail"/"sleep" scripts
+# produce an error reply or no reply
+FAKE_RUNNER = """
+import json, sys, time
+for line in sys.stdin:
+    source = json.loads(line)
+    if source == "sleep":
+        time.sleep(30)
+    reply = {"error": "boom (-600)"} if source == "fail" else {"result": f" ran {source} "}
+    print(json.dumps(reply), flush=True)
+"""
+
+
+@pytest.fixture
+def runner():
+    """A persistent runner backed by a Python process speaking the same protocol."""
+    import subprocess
+    import sys
+    from unittest.mock import patch
+
+    from email_nurse.applescript.base import _PersistentRunner
+
+    real_popen = subprocess.Popen
+
+    def fake_popen(args, **kwargs):
+        return real_popen([sys.executable, "-c", FAKE_RUNNER], **kwargs)
+
+    instance = _PersistentRunner()
+    with patch("email_nurse.applescript.base.subprocess.Popen", side_effect=fake_popen):
+        yield instance
+    instance.stop()
+
+
+class TestPersistentRunner:
+    """Tests for the long-lived osascript runner."""
+
+    def test_reuses_one_process(self, runner) -> None:
+        """Consecutive scripts share a process and results are stripped."""
+        assert runner.run("one", timeout=5) == "ran one"
+        first_proc = runner._proc
+        assert runner.run("two", timeout=5) == "ran two"
+        assert runner._proc is first_proc
+
+    def test_error_reply_raises(self, runner) -> None:
+        """Script errors surface as AppleScriptError with the error number."""
+        from email_nurse.applescript import AppleScriptError
+
+        with pytest.raises(AppleScriptError, match=r"\(-600\)"):
+            runner.run("fail", timeout=5)
+        assert runner.run("after", timeout=5) == "ran after"
+
+    def test_timeout_restarts_process(self, runner) -> None:
+        """A hung script is abandoned and the next call gets a new process."""
+        from email_nurse.applescript import AppleScriptError
+
+        runner.run("warm", timeout=5)
+        hung_proc = runner._proc
+        with pytest.raises(AppleScriptError, match="timed out"):
+            runner.run("sleep", timeout=1)
+        assert runner.run("next", timeout=5) == "ran next"
+        assert runner._proc is not hung_proc
+
+    def test_unwritable_runner_falls_back_to_osascript(self) -> None:
+        """A broken pipe to the runner reruns the script as a one-off osascript."""
+        import subprocess
+        from unittest.mock import MagicMock, patch
+
+        from email_nurse.applescript import base
+
+        proc = MagicMock()
+        proc.poll.return_value = None
+        proc.stdin.write.side_effect = BrokenPipeError()
+        completed = subprocess.CompletedProcess([], 0, stdout="one-off\n", stderr="")
+        settings = MagicMock(applescript_persistent=True)
+
+        with (
+            patch("email_nurse.config.get_settings", return_value=settings),
+            patch.object(base._runner, "_proc", proc),
+            patch.object(base.subprocess, "run", return_value=completed) as run,
+        ):
+            assert base.run_applescript("return 1") == "one-off"
+            assert base._runner._proc is None
+
+        run.assert_called_once()
+        proc.kill.assert_called_once()
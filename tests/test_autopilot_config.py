@@ -0,0 +1,81 @@
+"""Tests for autopilot config loading."""
+
+import os
+from pathlib import Path
+
+import yaml
+
+from email_nurse.autopilot import config as config_module
+from email_nurse.autopilot.config import QuickRule, load_autopilot_config
+
+CONFIG_YAML = """\
+autopilot:
+  instructions: Archive newsletters.
+  mailboxes: [INBOX]
+"""
+
+
+class TestLoadAutopilotConfig:
+    """Tests for load_autopilot_config()."""
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """A missing file yields None."""
+        assert load_autopilot_config(tmp_path / "missing.yaml") is None
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path: Path, monkeypatch) -> None:
+        """Repeated loads of an unchanged file skip YAML parsing."""
+        path = tmp_path / "autopilot.yaml"
+        path.write_text(CONFIG_YAML)
+        calls = []
+        real_load = config_module.yaml.load
+        monkeypatch.setattr(
+            config_module.yaml, "load", lambda *a, **kw: calls.append(1) or real_load(*a, **kw)
+        )
+
+        first = load_autopilot_config(path)
+        second = load_autopilot_config(path)
+
+        assert len(calls) == 1
+        assert first.instructions == second.instructions == "Archive newsletters."
+
+    def test_changed_file_is_reparsed(self, tmp_path: Path) -> None:
+        """Edits to the file invalidate the cached config."""
+        path = tmp_path / "autopilot.yaml"
+        path.write_text(CONFIG_YAML)
+        assert load_autopilot_config(path).mailboxes == ["INBOX"]
+
+        path.write_text(CONFIG_YAML.replace("[INBOX]", "[INBOX, Archive]"))
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert load_autopilot_config(path).mailboxes == ["INBOX", "Archive"]
+
+    def test_returns_independent_copies(self, tmp_path: Path) -> None:
+        """Mutating a loaded config does not leak into later loads."""
+        path = tmp_path / "autopilot.yaml"
+        path.write_text(CONFIG_YAML)
+
+        config = load_autopilot_config(path)
+        config.accounts = ["Work"]
+        config.mailboxes.append("Junk")
+
+        fresh = load_autopilot_config(path)
+        assert fresh.accounts is None
+        assert fresh.mailboxes == ["INBOX"]
+
+
+class TestQuickRuleYamlBlock:
+    """Tests for QuickRule.to_yaml_block()."""
+
+    def test_round_trips_through_yaml(self) -> None:
+        """The rendered block parses back into the same rule."""
+        rule = QuickRule(
+            name="Receipts",
+            match={"sender_domain": ["shop.com"], "subject_contains": ["receipt", "order"]},
+            actions=["mark_read", "move"],
+            folder="Receipts",
+        )
+
+        data = yaml.safe_load("quick_rules:\n" + rule.to_yaml_block())
+
+        assert QuickRule(**data["quick_rules"][0]) == rule
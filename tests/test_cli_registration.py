@@ -0,0 +1,85 @@
+"""Tests for argv-based CLI command module selection."""
+
+import subprocess
+import sys
+
+from email_nurse.cli import _modules_for_argv
+
+ALL_MODULES = [
+    "general",
+    "accounts",
+    "messages",
+    "autopilot",
+    "autopilot_admin",
+    "reminders",
+    "calendar",
+    "ops",
+]
+
+
+class TestModulesForArgv:
+    """Tests for _modules_for_argv()."""
+
+    def test_hot_command_loads_group_module_only(self) -> None:
+        """Everyday commands skip the rarely used modules."""
+        assert _modules_for_argv(["autopilot", "run", "--dry-run"]) == ["autopilot"]
+        assert _modules_for_argv(["messages", "list"]) == ["messages"]
+
+    def test_rare_command_loads_admin_module(self) -> None:
+        """Rarely used autopilot commands come from autopilot_admin."""
+        assert _modules_for_argv(["autopilot", "reset", "--force"]) == ["autopilot_admin"]
+        assert _modules_for_argv(["autopilot", "init"]) == ["autopilot_admin"]
+
+    def test_group_help_loads_whole_group(self) -> None:
+        """Group help lists every command in the group."""
+        assert _modules_for_argv(["autopilot"]) == ["autopilot", "autopilot_admin"]
+        assert _modules_for_argv(["autopilot", "--help"]) == ["autopilot", "autopilot_admin"]
+
+    def test_root_and_unknown_load_everything(self) -> None:
+        """Root help, root commands, and unknown names load all modules."""
+        assert _modules_for_argv([]) == ALL_MODULES
+        assert _modules_for_argv(["--help"]) == ALL_MODULES
+        assert _modules_for_argv(["version"]) == ALL_MODULES
+
+    def test_completion_loads_everything(self, monkeypatch) -> None:
+        """Shell completion needs the full command tree."""
+        monkeypatch.setenv("_EMAIL_NURSE_COMPLETE", "complete_bash")
+        assert _modules_for_argv(["autopilot", "run"]) == ALL_MODULES
+
+
+def _run_cli_snippet(argv: list[str], body: str) -> str:
+    """Run body in a fresh interpreter with sys.argv set; return its last line."""
+    code = f"import sys\nsys.argv = {['email-nurse', *argv]!r}\n{body}"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return out.splitlines()[-1]
+
+
+class TestCommandRegistration:
+    """Tests for which entry points register which commands."""
+
+    def test_importing_app_registers_every_command(self) -> None:
+        """Importers of app get the full tree whatever sys.argv holds."""
+        body = (
+            "import typer\n"
+            "from email_nurse.cli import app\n"
+            "root = typer.main.get_command(app)\n"
+            "print(sorted(root.commands['autopilot'].commands), 'version' in root.commands)\n"
+        )
+        last = _run_cli_snippet(["messages", "list"], body)
+        assert "'init'" in last and "'run'" in last
+        assert last.endswith("True")
+
+    def test_main_registers_only_what_argv_needs(self) -> None:
+        """The console script skips modules the command does not use."""
+        body = (
+            "from email_nurse.cli import main\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sorted(m for m in sys.modules if m.startswith('email_nurse.cli.')))\n"
+        )
+        last = _run_cli_snippet(["autopilot", "run", "--help"], body)
+        assert last == "['email_nurse.cli.autopilot']"
@@ -0,0 +1,144 @@
+"""Tests for per-account and shared error logging."""
+
+import json
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from email_nurse import logging as en_logging
+
+
+@pytest.fixture
+def log_dir(tmp_path: Path) -> Iterator[Path]:
+    """Logging set up in a temporary directory, reset afterwards."""
+    en_logging.reset_logging()
+    en_logging.setup_logging(log_dir=tmp_path)
+    yield tmp_path
+    en_logging.reset_logging()
+
+
+class TestAccountLogger:
+    """Tests for get_account_logger()."""
+
+    def test_errors_reach_error_log_with_account_prefix(self, log_dir: Path) -> None:
+        """ERROR records go to both logs; only the error log shows the account."""
+        logger = en_logging.get_account_logger("50% Off")
+        logger.info("checked %d messages", 3)
+        logger.error("move failed for %s", "msg-1")
+        en_logging.get_error_logger().error("direct error")
+        en_logging.reset_logging()  # drains the queue into the files
+
+        account_log = (log_dir / "email-nurse-50--Off.log").read_text()
+        error_log = (log_dir / "email-nurse-error.log").read_text()
+
+        assert "[INFO] checked 3 messages" in account_log
+        assert "[ERROR] move failed for msg-1" in account_log
+        assert "[ERROR] [50% Off] move failed for msg-1" in error_log
+        assert "[ERROR] direct error" in error_log
+        assert "checked 3 messages" not in error_log
+
+    def test_logger_is_reused(self, log_dir: Path) -> None:
+        """Repeated lookups return the same logger without extra handlers."""
+        first = en_logging.get_account_logger("Work")
+        second = en_logging.get_account_logger("Work")
+
+        assert first is second
+        assert len(first.handlers) == 1
+
+    def test_reset_writes_buffered_records_and_closes_files(
+        self, log_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Records still in a buffer at reset are written and the file is closed."""
+        # Keep the record buffered past the listener's final flush
+        monkeypatch.setattr(en_logging, "_flush_buffers", lambda: None)
+        en_logging.get_account_logger("Work")
+        buffered = en_logging._buffers[0]
+        target = buffered.target
+        record = logging.LogRecord("t", logging.INFO, __file__, 1, "late record", None, None)
+        buffered.handle(record)
+
+        en_logging.reset_logging()
+
+        assert "late record" in (log_dir / "email-nurse-Work.log").read_text()
+        assert target.stream is None
+
+    def test_combined_mode_writes_one_jsonl_file(self, log_dir: Path) -> None:
+        """In combined mode every account shares email-nurse.jsonl."""
+        en_logging.reset_logging()
+        en_logging.setup_logging(log_dir=log_dir, combined=True)
+        en_logging.get_account_logger("iCloud").info("one")
+        en_logging.get_account_logger("Work").error("two")
+        en_logging.reset_logging()
+
+        lines = [json.loads(line) for line in (log_dir / "email-nurse.jsonl").read_text().splitlines()]
+
+        assert [(r["account"], r["level"], r["msg"]) for r in lines] == [
+            ("iCloud", "INFO", "one"),
+            ("Work", "ERROR", "two"),
+        ]
+        assert not list(log_dir.glob("email-nurse-iCloud.log"))
+        assert "[ERROR] [Work] two" in (log_dir / "email-nurse-error.log").read_text()
+
+
+class TestRawAppendHandler:
+    """Tests for RawAppendHandler."""
+
+    @staticmethod
+    def _record(msg: str) -> logging.LogRecord:
+        return logging.LogRecord("t", logging.INFO, __file__, 1, msg, None, None)
+
+    def test_rolls_over_at_size_limit(self, tmp_path: Path) -> None:
+        """The in-memory size counter triggers rotation like the file size would."""
+        path = tmp_path / "account.log"
+        path.write_text("existing line\n")
+        handler = en_logging.RawAppendHandler(path, maxBytes=40, backupCount=1)
+        try:
+            for i in range(3):
+                handler.handle(self._record(f"message number {i}"))
+        finally:
+            handler.close()
+
+        assert (tmp_path / "account.log.1").read_text() == "existing line\nmessage number 0\n"
+        assert path.read_text() == "message number 1\nmessage number 2\n"
+
+    def test_empty_file_never_rolls_over(self, tmp_path: Path) -> None:
+        """A single oversized record is written without rotating an empty file."""
+        path = tmp_path / "account.log"
+        handler = en_logging.RawAppendHandler(path, maxBytes=10, backupCount=1)
+        try:
+            assert not handler.shouldRollover(self._record("x" * 50))
+            handler.handle(self._record("x" * 50))
+            assert handler.shouldRollover(self._record("y"))
+        finally:
+            handler.close()
+
+        assert not (tmp_path / "account.log.1").exists()
+
+    def test_writes_utf8(self, tmp_path: Path) -> None:
+        """Non-ASCII messages are written as UTF-8."""
+        path = tmp_path / "account.log"
+        handler = en_logging.RawAppendHandler(path, maxBytes=0, backupCount=0)
+        try:
+            handler.handle(self._record("Café — 日本"))
+        finally:
+            handler.close()
+
+        assert path.read_text(encoding="utf-8") == "Café — 日本\n"
+
+
+class TestCachedTimeFormatter:
+    """Tests for CachedTimeFormatter."""
+
+    def test_matches_standard_formatter(self) -> None:
+        """Cached timestamps render exactly like logging.Formatter's."""
+        fmt = "%(asctime)s [%(levelname)s] %(message)s"
+        cached = en_logging.CachedTimeFormatter(fmt)
+        standard = logging.Formatter(fmt)
+
+        for created in (1700000000.001, 1700000000.999, 1700000001.5, 1700000000.25):
+            record = logging.LogRecord("t", logging.INFO, __file__, 1, "msg", None, None)
+            record.created = created
+            record.msecs = (created - int(created)) * 1000
+            assert cached.format(record) == standard.format(record)
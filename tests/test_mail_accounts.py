@@ -0,0 +1,61 @@
+"""Tests for Mail.app account listing."""
+
+from unittest.mock import patch
+
+import pytest
+
+from email_nurse.mail import accounts
+
+SYSM_ACCOUNTS = [{"name": "Work", "id": "A1", "emailAddresses": "me@work.com, alt@work.com"}]
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Each test starts and ends with an empty account cache."""
+    accounts.invalidate_accounts_cache()
+    yield
+    accounts.invalidate_accounts_cache()
+
+
+class TestGetAccounts:
+    """Tests for get_accounts()."""
+
+    @patch("email_nurse.mail.accounts.get_accounts_sysm", return_value=SYSM_ACCOUNTS)
+    def test_parses_comma_separated_addresses(self, mock_sysm):
+        """A comma-separated address string becomes a stripped list."""
+        (account,) = accounts.get_accounts()
+
+        assert account.name == "Work"
+        assert account.email_addresses == ["me@work.com", "alt@work.com"]
+
+    @patch(
+        "email_nurse.mail.accounts.get_accounts_sysm",
+        return_value=[{"name": "Old", "enabled": False}, {"name": "New"}],
+    )
+    def test_enabled_is_json_boolean(self, mock_sysm):
+        """sysm reports enabled as a JSON boolean; a missing field means enabled."""
+        old, new = accounts.get_accounts()
+
+        assert old.enabled is False
+        assert new.enabled is True
+
+    @patch("email_nurse.mail.accounts.get_accounts_sysm", return_value=SYSM_ACCOUNTS)
+    def test_repeat_calls_use_cache(self, mock_sysm):
+        """A second lookup within the TTL does not call sysm again."""
+        first = accounts.get_accounts()
+        second = accounts.get_accounts()
+
+        assert first == second
+        assert mock_sysm.call_count == 1
+
+    @patch("email_nurse.mail.accounts.get_accounts_sysm", return_value=SYSM_ACCOUNTS)
+    def test_cache_expires_and_can_be_invalidated(self, mock_sysm):
+        """Invalidation or an expired TTL triggers a fresh sysm call."""
+        accounts.get_accounts()
+        accounts.invalidate_accounts_cache()
+        accounts.get_accounts()
+        assert mock_sysm.call_count == 2
+
+        with patch("email_nurse.mail.accounts.time.monotonic", return_value=1e12):
+            accounts.get_accounts()
+        assert mock_sysm.call_count == 3
@@ -0,0 +1,58 @@
+"""Tests for fuzzy mailbox name matching."""
+
+from unittest.mock import patch
+
+import pytest
+
+from email_nurse.mail import actions
+from email_nurse.mail.actions import find_similar_mailbox, mailbox_exists
+
+MAILBOXES = ["INBOX", "Receipts", "Newsletters", "Travel/Flights"]
+
+
+@pytest.fixture(params=["native", "difflib"])
+def matcher(request):
+    """Run each test with rapidfuzz (when installed) and the difflib fallback."""
+    if request.param == "native":
+        if actions._fuzz_process is None:
+            pytest.skip("rapidfuzz not installed")
+        yield
+    else:
+        with patch.object(actions, "_fuzz_process", None):
+            yield
+
+
+class TestFindSimilarMailbox:
+    """Tests for find_similar_mailbox()."""
+
+    def test_exact_match_ignores_case(self, matcher):
+        """A case-insensitive exact match returns the existing spelling."""
+        assert find_similar_mailbox("receipts", MAILBOXES) == "Receipts"
+
+    def test_close_match(self, matcher):
+        """A near miss resolves to the closest mailbox."""
+        assert find_similar_mailbox("Newsleters", MAILBOXES) == "Newsletters"
+
+    def test_no_match_below_threshold(self, matcher):
+        """Unrelated names return None."""
+        assert find_similar_mailbox("Zzz", MAILBOXES) is None
+
+    def test_empty_list(self, matcher):
+        """No candidates means no match."""
+        assert find_similar_mailbox("Receipts", []) is None
+
+
+class TestMailboxExists:
+    """Tests for mailbox_exists()."""
+
+    def test_ignores_case(self):
+        """Existence checks match regardless of case."""
+        assert mailbox_exists("travel/flights", MAILBOXES)
+        assert not mailbox_exists("Travel", MAILBOXES)
+
+    def test_sees_appended_mailbox(self):
+        """A mailbox appended to the list after a lookup is found."""
+        mailboxes = list(MAILBOXES)
+        assert not mailbox_exists("Archive", mailboxes)
+        mailboxes.append("Archive")
+        assert mailbox_exists("archive", mailboxes)
@@ -0,0 +1,99 @@
+"""Tests for appending quick rules to autopilot.yaml."""
+
+from pathlib import Path
+
+import yaml
+
+from email_nurse.autopilot.config import QuickRule
+from email_nurse.cli.autopilot_admin import _append_quick_rules_to_config
+
+RULE = QuickRule(name="Spam", match={"sender_contains": ["spam.biz"]}, action="delete")
+OTHER = QuickRule(
+    name="Receipts", match={"subject_contains": ["receipt"]}, action="move", folder="Receipts"
+)
+
+
+def _quick_rule_names(path: Path) -> list[str]:
+    return [r["name"] for r in yaml.safe_load(path.read_text())["quick_rules"]]
+
+
+class TestAppendQuickRule:
+    """Tests for _append_quick_rules_to_config()."""
+
+    def test_appends_at_end_of_last_section(self, tmp_path: Path) -> None:
+        """A trailing quick_rules section gets the rule appended."""
+        path = tmp_path / "autopilot.yaml"
+        path.write_text(
+            'autopilot:\n  instructions: x\n\nquick_rules:\n  - name: "Old"\n'
+            '    match:\n      sender_contains: ["a"]\n    action: archive\n'
+        )
+
+        _append_quick_rules_to_config(path, [RULE])
+
+        assert _quick_rule_names(path) == ["Old", "Spam"]
+
+    def test_inserts_before_next_section(self, tmp_path: Path) -> None:
+        """Rules land inside quick_rules and later sections are kept intact."""
+        path = tmp_path / "autopilot.yaml"
+        path.write_text(
+            'quick_rules:\n  - name: "Old"\n    match:\n      sender_contains: ["a"]\n'
+            "    action: archive\n\nautopilot:\n  instructions: x\n"
+        )
+
+        _append_quick_rules_to_config(path, [RULE])
+
+        data = yaml.safe_load(path.read_text())
+        assert [r["name"] for r in data["quick_rules"]] == ["Old", "Spam"]
+        assert data["autopilot"] == {"instructions": "x"}
+        assert path.read_text().endswith("\nautopilot:\n  instructions: x\n")
+
+    def test_creates_missing_section(self, tmp_path: Path) -> None:
+        """A config without quick_rules gains the section."""
+        path = tmp_path / "autopilot.yaml"
+        path.write_text("autopilot:\n  instructions: x\n")
+
+        _append_quick_rules_to_config(path, [RULE])
+
+        assert _quick_rule_names(path) == ["Spam"]
+
+    def test_multiple_rules_in_one_call(self, tmp_path: Path) -> None:
+        """Several rules are inserted together, in order."""
+        path = tmp_path / "autopilot.yaml"
+        path.write_text(
+            'quick_rules:\n  - name: "Old"\n    match:\n      sender_contains: ["a"]\n'
+            "    action: archive\n\nautopilot:\n  instructions: x\n"
+        )
+
+        _append_quick_rules_to_config(path, [RULE, OTHER])
+
+        data = yaml.safe_load(path.read_text())
+        assert [r["name"] for r in data["quick_rules"]] == ["Old", "Spam", "Receipts"]
+        assert data["quick_rules"][2]["folder"] == "Receipts"
+
+    def test_comments_and_blank_lines_stay_in_section(self, tmp_path: Path) -> None:
+        """Column-0 comments and blank lines do not end the quick_rules section."""
+        path = tmp_path / "autopilot.yaml"
+        path.write_text(
+            'quick_rules:\n  - name: "Old"\n    match:\n      sender_contains: ["a"]\n'
+            "    action: archive\n\n# More rules below\n\n"
+            'exclude_senders: ["x@example.com"]\n'
+        )
+
+        _append_quick_rules_to_config(path, [RULE])
+
+        data = yaml.safe_load(path.read_text())
+        assert [r["name"] for r in data["quick_rules"]] == ["Old", "Spam"]
+        assert data["exclude_senders"] == ["x@example.com"]
+
+    def test_tab_indented_line_stays_in_section(self, tmp_path: Path) -> None:
+        """A tab-indented line is not mistaken for the next top-level key."""
+        path = tmp_path / "autopilot.yaml"
+        path.write_text(
+            'quick_rules:\n  - name: "Old"\n    match:\n      sender_contains: ["a"]\n'
+            "    action: archive\n\t# tab-indented note\n"
+        )
+
+        _append_quick_rules_to_config(path, [RULE])
+
+        content = path.read_text()
+        assert content.index("\t# tab-indented note") < content.index('name: "Spam"')
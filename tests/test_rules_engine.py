@@ -92,6 +92,34 @@ class TestRuleEngine:
         )
         assert engine.rules[0].name == "First Priority"
 
+    def test_add_rule_after_equal_priority(self) -> None:
+        """Test that a rule added at an existing priority goes after its peers."""
+        engine = RuleEngine(
+            rules=[
+                Rule(
+                    name="Existing",
+                    priority=50,
+                    conditions=[],
+                    action=RuleAction(action=EmailAction.IGNORE),
+                ),
+                Rule(
+                    name="Last",
+                    priority=90,
+                    conditions=[],
+                    action=RuleAction(action=EmailAction.IGNORE),
+                ),
+            ]
+        )
+        engine.add_rule(
+            Rule(
+                name="Added",
+                priority=50,
+                conditions=[],
+                action=RuleAction(action=EmailAction.FLAG),
+            )
+        )
+        assert [r.name for r in engine.rules] == ["Existing", "Added", "Last"]
+
     def test_remove_rule(self) -> None:
         """Test rule removal."""
         engine = RuleEngine(
@@ -0,0 +1,117 @@
+"""Tests for SMTP sending."""
+
+import smtplib
+from email.message import EmailMessage
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from email_nurse.mail.actions import SmtpSender, _build_message, send_email_smtp
+
+
+@pytest.fixture
+def smtp_cls():
+    """Patch smtplib.SMTP with a mock that hands out fresh sessions."""
+    with patch("email_nurse.mail.actions.smtplib.SMTP") as cls:
+        cls.side_effect = lambda *args, **kwargs: MagicMock()
+        yield cls
+
+
+def _message():
+    return _build_message("me@example.com", "you@example.com", "Hi", "Body")
+
+
+class TestSmtpSender:
+    """Tests for SmtpSender."""
+
+    def test_session_is_shared_across_sends(self, smtp_cls) -> None:
+        """Connect and login happen once for several messages."""
+        with SmtpSender("smtp.example.com", 587, "me", "pw") as sender:
+            server = sender._server
+            sender.send(_message())
+            sender.send(_message())
+
+        assert smtp_cls.call_count == 1
+        server.login.assert_called_once_with("me", "pw")
+        assert server.send_message.call_count == 2
+        server.quit.assert_called_once()
+
+    def test_reconnects_after_disconnect(self, smtp_cls) -> None:
+        """A dropped session is replaced and the message is resent."""
+        with SmtpSender("smtp.example.com", 587, "me", "pw") as sender:
+            sender._server.send_message.side_effect = smtplib.SMTPServerDisconnected()
+            sender.send(_message())
+            replacement = sender._server
+
+        assert smtp_cls.call_count == 2
+        replacement.send_message.assert_called_once()
+
+    def test_idle_session_is_checked_with_noop(self, smtp_cls) -> None:
+        """A session idle past the keep-alive window is probed before sending."""
+        with SmtpSender("smtp.example.com", 587, "me", "pw") as sender:
+            server = sender._server
+            sender._last_used -= SmtpSender.KEEPALIVE_SECONDS + 1
+            sender.send(_message())
+
+        server.noop.assert_called_once()
+        assert smtp_cls.call_count == 1
+
+
+    def test_failed_starttls_closes_connection(self, smtp_cls) -> None:
+        """A handshake failure before login still closes the socket."""
+        server = MagicMock()
+        server.starttls.side_effect = smtplib.SMTPNotSupportedError()
+        smtp_cls.side_effect = None
+        smtp_cls.return_value = server
+
+        with (
+            pytest.raises(smtplib.SMTPNotSupportedError),
+            SmtpSender("smtp.example.com", 587, "me", "pw"),
+        ):
+            pass
+
+        server.close.assert_called_once()
+        server.login.assert_not_called()
+
+
+class TestBuildMessage:
+    """Tests for _build_message()."""
+
+    @pytest.mark.parametrize(
+        "body",
+        ["Hello\nWorld", "Line\r\n", "", "x" * 78, "word " * 20, "x" * 1200, "Café"],
+    )
+    def test_matches_set_content(self, body: str) -> None:
+        """The ASCII shortcut serializes exactly like EmailMessage.set_content()."""
+        expected = EmailMessage()
+        expected["From"] = "me@example.com"
+        expected["To"] = "you@example.com"
+        expected["Subject"] = "Hi"
+        expected.set_content(body)
+
+        msg = _build_message("me@example.com", "you@example.com", "Hi", body)
+
+        assert msg.as_bytes() == expected.as_bytes()
+
+
+class TestSendEmailSmtp:
+    """Tests for send_email_smtp()."""
+
+    def test_auth_failure_raises_runtime_error(self, smtp_cls) -> None:
+        """Login errors surface as RuntimeError."""
+        server = MagicMock()
+        server.login.side_effect = smtplib.SMTPAuthenticationError(535, b"bad credentials")
+        smtp_cls.side_effect = None
+        smtp_cls.return_value = server
+
+        with pytest.raises(RuntimeError, match="SMTP authentication failed"):
+            send_email_smtp(
+                "you@example.com",
+                "Hi",
+                "Body",
+                smtp_host="smtp.example.com",
+                smtp_port=587,
+                smtp_username="me",
+                smtp_password="pw",
+            )
+        server.close.assert_called_once()
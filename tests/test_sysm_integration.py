@@ -16,7 +16,7 @@ from email_nurse.mail.sysm import SysmError
 class TestSysmMode:
     """Tests for sysm provider mode (never falls back to AppleScript)."""
 
-    @patch("email_nurse.mail.messages.Settings")
+    @patch("email_nurse.mail.messages.get_settings")
     @patch("email_nurse.mail.sysm.run_sysm_json")
     @patch("email_nurse.mail.messages.run_applescript")
     def test_get_messages_metadata_never_calls_applescript(self, mock_applescript, mock_sysm, mock_settings):
@@ -35,7 +35,7 @@ class TestSysmMode:
         assert not mock_applescript.called
         assert result == []
 
-    @patch("email_nurse.mail.messages.Settings")
+    @patch("email_nurse.mail.messages.get_settings")
     @patch("email_nurse.mail.sysm.run_sysm_json")
     @patch("email_nurse.mail.messages.run_applescript")
     def test_get_messages_never_calls_applescript(self, mock_applescript, mock_sysm, mock_settings):
@@ -52,7 +52,7 @@ class TestSysmMode:
         assert not mock_applescript.called
         assert result == []
 
-    @patch("email_nurse.mail.messages.Settings")
+    @patch("email_nurse.mail.messages.get_settings")
     @patch("email_nurse.mail.sysm.run_sysm_json")
     @patch("email_nurse.mail.messages.run_applescript")
     def test_sysm_mode_raises_on_error(self, mock_applescript, mock_sysm, mock_settings, sample_email):
@@ -99,7 +99,7 @@ class TestProviderConfiguration:
 class TestEndToEnd:
     """End-to-end tests with realistic scenarios."""
 
-    @patch("email_nurse.mail.messages.Settings")
+    @patch("email_nurse.mail.messages.get_settings")
     @patch("email_nurse.mail.sysm.run_sysm_json")
     def test_sysm_full_workflow(self, mock_sysm, mock_settings):
         """Test full workflow with sysm provider."""
@@ -347,3 +347,32 @@ class TestBatchMoveTracking:
 
         assert count == 0
         assert ids == set()
+
+
+class TestQuickRuleStatusActions:
+    """Tests for quick rule read/flag actions running per message."""
+
+    def test_failed_mark_read_leaves_message_unprocessed(self, sample_email):
+        """A sysm failure on mark_read is retried next scan, not marked processed."""
+        from email_nurse.autopilot.config import QuickRule
+        from email_nurse.autopilot.engine import AutopilotEngine
+
+        engine = MagicMock(spec=AutopilotEngine)
+        engine.db = MagicMock()
+        engine.config = MagicMock(main_account=None)
+        engine._is_local_folder.return_value = False
+        engine.db.increment_rule_failure.return_value = 1
+        engine._deferred_processed = []
+        rule = QuickRule(name="Read", match={"sender_contains": ["sender"]}, action="mark_read")
+
+        with patch("email_nurse.mail.sysm.run_sysm", side_effect=SysmError("sysm timed out")), patch(
+            "email_nurse.autopilot.quick_rules.get_account_logger",
+            return_value=MagicMock(),
+        ):
+            result = AutopilotEngine._execute_quick_rule(
+                engine, sample_email, rule, dry_run=False, interactive=False
+            )
+
+        assert result.success is False
+        engine.db.mark_processed.assert_not_called()
+        assert engine._deferred_processed == []
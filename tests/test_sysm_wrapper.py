@@ -2,7 +2,7 @@
 
 import json
 from subprocess import CalledProcessError, TimeoutExpired
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -64,6 +64,20 @@ class TestRunSysm:
         with pytest.raises(SysmNotFoundError, match="sysm binary not found"):
             run_sysm(["mail", "inbox"])
 
+    @patch("email_nurse.mail.sysm.shutil.which")
+    @patch("email_nurse.mail.sysm.subprocess.run")
+    def test_moved_binary_is_looked_up_again(self, mock_run, mock_which):
+        """A vanished cached binary raises SysmNotFoundError and clears the cache."""
+        mock_which.side_effect = ["/old/bin/sysm", "/new/bin/sysm"]
+        mock_run.side_effect = [FileNotFoundError(), MagicMock(stdout="ok")]
+
+        with patch("email_nurse.mail.sysm._sysm_path", None):
+            with pytest.raises(SysmNotFoundError, match="/old/bin/sysm"):
+                run_sysm(["mail", "inbox"])
+            assert run_sysm(["mail", "inbox"]) == "ok"
+
+        assert mock_run.call_args[0][0][0] == "/new/bin/sysm"
+
     @patch("email_nurse.mail.sysm._find_sysm")
     @patch("email_nurse.mail.sysm.subprocess.run")
     def test_command_error(self, mock_run, mock_find):